@@ -1,6 +1,23 @@
 """Core package for pdf-bulk-filler."""
 
-from .main import main, run_cli
-from .ui.main_window import MainWindow
+from __future__ import annotations
+
+from typing import Any
 
 __all__ = ["main", "run_cli", "MainWindow"]
+
+
+def __getattr__(name: str) -> Any:
+    # Imported on first use so that non-GUI modules (e.g. pdf.engine in process-pool
+    # workers) can be imported without pulling in Qt.
+    if name in ("main", "run_cli"):
+        from .main import main, run_cli
+
+        # Importing the submodule binds ``main`` to it; rebind the entry point functions.
+        globals().update(main=main, run_cli=run_cli)
+        return globals()[name]
+    if name == "MainWindow":
+        from .ui.main_window import MainWindow
+
+        return MainWindow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,13 +3,10 @@
 from __future__ import annotations
 
 import argparse
+import multiprocessing
 from pathlib import Path
 import sys
 
-from PySide6 import QtCore, QtWidgets
-
-from pdf_bulk_filler.ui.main_window import MainWindow
-
 _PROJECT_VERSION = "0.1.0"
 
 
@@ -56,11 +53,19 @@ def run_cli(args: list[str] | None = None) -> int:
 
 def main() -> int:
     """Entrypoint used by console scripts."""
+    # PDF generation may spawn worker processes; frozen builds must hand those off here.
+    multiprocessing.freeze_support()
     return run_cli()
 
 
 def launch_app(options: argparse.Namespace) -> int:
     """Create and run the Qt application."""
+    # Imported here rather than at module level: spawned PDF worker processes re-import the
+    # entry point module and must not load Qt.
+    from PySide6 import QtCore, QtWidgets
+
+    from pdf_bulk_filler.ui.main_window import MainWindow
+
     app = QtWidgets.QApplication.instance()
     if app is None:
         app = QtWidgets.QApplication(sys.argv)
@@ -103,19 +103,17 @@ class MappingModel:
         case_map: Dict[str, Dict[str, object]] = {}
 
         if isinstance(cases, Mapping):
-            for key, outputs in cases.items():
-                if isinstance(outputs, Mapping):
-                    case_map[str(key)] = copy.deepcopy(outputs)
+            case_map = {
+                str(key): copy.deepcopy(outputs) for key, outputs in cases.items() if isinstance(outputs, Mapping)
+            }
         elif isinstance(cases, Iterable) and not isinstance(cases, (str, bytes)):
-            for case in cases:
-                if not isinstance(case, Mapping):
-                    continue
-                match_value = str(case.get("match", "")).strip()
-                if not match_value:
-                    continue
-                outputs = case.get("outputs")
-                if isinstance(outputs, Mapping):
-                    case_map[match_value] = copy.deepcopy(outputs)
+            case_map = {
+                match_value: copy.deepcopy(case["outputs"])
+                for case in cases
+                if isinstance(case, Mapping)
+                and (match_value := str(case.get("match", "")).strip())
+                and isinstance(case.get("outputs"), Mapping)
+            }
 
         if case_map:
             options["case_map"] = case_map
@@ -2,16 +2,40 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 import io
+import multiprocessing
+import operator
+import os
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 import fitz  # PyMuPDF
 from PyPDF2 import PdfReader, PdfWriter
-from PyPDF2.generic import BooleanObject, DictionaryObject, NameObject, NumberObject
-
-from pdf_bulk_filler.mapping.rules import coerce_rules, evaluate_rules
+from PyPDF2.generic import BooleanObject, DictionaryObject, NameObject, NumberObject, TextStringObject
+
+from pdf_bulk_filler.mapping.rules import MappingRule, coerce_rules, evaluate_rules
+
+_ACRO_FORM_KEY = NameObject("/AcroForm")
+_NEED_APPEARANCES_KEY = NameObject("/NeedAppearances")
+_VALUE_KEY = NameObject("/V")
+_STATE_KEY = NameObject("/AS")
+_FLAGS_KEY = NameObject("/Ff")
+_OFF_STATE = NameObject("/Off")
+_YES_STATE = NameObject("/Yes")
+
+# Below this many rows, starting worker processes costs more than filling serially. Each
+# spawned worker needs ~0.5 s to start, re-import the entry point module and import the engine
+# (measured through ``pdf_bulk_filler.main``, which keeps Qt out of workers), against ~1.2 ms
+# per interactive row and ~4.4 ms per flattened row on the sample invoice; the thresholds
+# leave roughly a 2x margin over break-even (~830 and ~230 rows) with two workers.
+_PARALLEL_MIN_ROWS = 2000
+_PARALLEL_MIN_ROWS_FLATTEN = 500
+# Upper bound on rows per worker task, so a cancel request waits for at most one short chunk
+# per worker.
+_PARALLEL_CHUNK_ROWS = 64
 
 
 @dataclass(frozen=True)
@@ -79,29 +103,32 @@ class PdfEngine:
         flatten: bool = False,
         template_metadata: Optional[PdfTemplate] = None,
         read_only: bool = False,
+        cancel_event: threading.Event | None = None,
     ) -> List[Path]:
-        """Fill a PDF for each row and write the results to ``destination_dir``."""
+        """Fill a PDF for each row and write the results to ``destination_dir``.
+
+        ``rows`` is consumed lazily; progress totals come from its length hint (0 when unknown).
+        When ``cancel_event`` is set, generation stops before the next row and the
+        outputs written so far are returned. The template is always re-read from
+        ``template_path``; ``template_metadata`` is ignored and only kept for compatibility
+        (its document belongs to the GUI thread, and PyMuPDF documents are not thread-safe).
+        """
         template_path = template_path.expanduser().resolve()
         destination_dir = destination_dir.expanduser().resolve()
         destination_dir.mkdir(parents=True, exist_ok=True)
 
         rules = coerce_rules(rule_spec)
 
-        if not isinstance(rows, list):
-            rows = list(rows)
-
-        base_doc = None
-        close_base_doc = False
-        if flatten:
-            if template_metadata:
-                base_doc = template_metadata.document
-            else:
-                base_doc = fitz.open(template_path)
-                close_base_doc = True
+        template_bytes = template_path.read_bytes()
+        # Parsed and cloned once; each row's edits are undone before the next row is filled.
+        form = None if flatten else _ReusableFormWriter(PdfReader(io.BytesIO(template_bytes)), read_only)
+        flat_template = _FlattenedTemplate(template_bytes) if flatten else None
 
         outputs: List[Path] = []
-        total_rows = len(rows)
+        total_rows = operator.length_hint(rows, 0)
         for index, row in enumerate(rows, start=1):
+            if cancel_event is not None and cancel_event.is_set():
+                break
             row_mapping: Mapping[str, Any]
             if isinstance(row, Mapping):
                 row_mapping = row
@@ -110,58 +137,142 @@ class PdfEngine:
 
             payload = evaluate_rules(rules, row_mapping)
 
-            label_value = row_mapping.get(index_field) or index
-            filename_value: str = ""
-            if filename_builder is not None:
-                try:
-                    filename_value = str(filename_builder(row_mapping, index)).strip()
-                except Exception:
-                    filename_value = ""
-            if not filename_value:
-                filename_value = str(filename_pattern.format(index=index, field=label_value))
-            sanitized = filename_value.replace("/", "_").replace("\\", "_").strip()
-            if not sanitized:
-                sanitized = f"{index:05d}"
-            output_path = destination_dir / f"{sanitized}.pdf"
+            output_name = self._output_name(row_mapping, index, filename_builder, filename_pattern, index_field)
+            output_path = destination_dir / f"{output_name}.pdf"
 
             if flatten:
                 self._write_flattened_pdf(
-                    template_doc=base_doc,
-                    template_path=template_path,
+                    flat_template,
                     payload=payload,
                     output_path=output_path,
                 )
             else:
-                self._write_interactive_pdf(
-                    template_path,
-                    payload,
-                    output_path,
-                    read_only=read_only,
-                )
+                self._write_interactive_pdf(form, payload, output_path)
 
             outputs.append(output_path)
             if progress_callback:
                 progress_callback(index, total_rows)
 
-        if close_base_doc and base_doc is not None:
-            base_doc.close()
-
         return outputs
 
-    def _write_interactive_pdf(
+    def fill_rows_parallel(
         self,
         template_path: Path,
-        payload: Dict[str, object],
-        output_path: Path,
+        destination_dir: Path,
+        rule_spec: Any,
+        rows: Iterable[Dict[str, object]],
         *,
+        filename_pattern: str = "{index:05d}_{field}",
+        index_field: str = "id",
+        filename_builder: Callable[[Mapping[str, Any], int], str] | None = None,
+        progress_callback: callable | None = None,
+        flatten: bool = False,
         read_only: bool = False,
+        cancel_event: threading.Event | None = None,
+        max_workers: int | None = None,
+    ) -> List[Path]:
+        """Like ``fill_rows``, but spread sized batches over worker processes.
+
+        Output names are resolved here, in row order, so stateful ``filename_builder``s keep
+        working; progress is reported per finished chunk. Streams, small batches and
+        single-CPU machines fall back to ``fill_rows``.
+        """
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 1) - 1)
+        min_rows = _PARALLEL_MIN_ROWS_FLATTEN if flatten else _PARALLEL_MIN_ROWS
+        if not isinstance(rows, Sequence) or max_workers < 2 or len(rows) < min_rows:
+            return self.fill_rows(
+                template_path,
+                destination_dir,
+                rule_spec,
+                rows,
+                filename_pattern=filename_pattern,
+                index_field=index_field,
+                filename_builder=filename_builder,
+                progress_callback=progress_callback,
+                flatten=flatten,
+                read_only=read_only,
+                cancel_event=cancel_event,
+            )
+
+        template_path = template_path.expanduser().resolve()
+        destination_dir = destination_dir.expanduser().resolve()
+        destination_dir.mkdir(parents=True, exist_ok=True)
+        rules = coerce_rules(rule_spec)
+
+        mappings = [row if isinstance(row, Mapping) else dict(row) for row in rows]
+        names = [
+            self._output_name(row, index, filename_builder, filename_pattern, index_field)
+            for index, row in enumerate(mappings, start=1)
+        ]
+        total_rows = len(mappings)
+        chunk_size = max(1, min(_PARALLEL_CHUNK_ROWS, total_rows // (4 * max_workers)))
+        results: Dict[int, List[Path]] = {}
+        done_rows = 0
+        # Spawned children start a fresh interpreter and import this module only; the package
+        # defers its Qt imports, so none of the GUI is loaded there.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+            futures = {
+                executor.submit(
+                    _fill_rows_chunk,
+                    template_path,
+                    destination_dir,
+                    rules,
+                    mappings[start : start + chunk_size],
+                    names[start : start + chunk_size],
+                    flatten,
+                    read_only,
+                ): start
+                for start in range(0, total_rows, chunk_size)
+            }
+            try:
+                for future in as_completed(futures):
+                    chunk_outputs = future.result()
+                    results[futures[future]] = chunk_outputs
+                    done_rows += len(chunk_outputs)
+                    if cancel_event is not None and cancel_event.is_set():
+                        executor.shutdown(wait=True, cancel_futures=True)
+                        break
+                    if progress_callback:
+                        progress_callback(done_rows, total_rows)
+            except BaseException:
+                # Don't fill the remaining chunks before reporting the failure.
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+        return [path for start in sorted(results) for path in results[start]]
+
+    @staticmethod
+    def _output_name(
+        row: Mapping[str, Any],
+        index: int,
+        filename_builder: Callable[[Mapping[str, Any], int], str] | None,
+        filename_pattern: str,
+        index_field: str,
+    ) -> str:
+        """Return the sanitized output file stem for ``row``."""
+        filename_value: str = ""
+        if filename_builder is not None:
+            try:
+                filename_value = str(filename_builder(row, index)).strip()
+            except Exception:
+                filename_value = ""
+        if not filename_value:
+            label_value = row.get(index_field) or index
+            filename_value = str(filename_pattern.format(index=index, field=label_value))
+        sanitized = filename_value.replace("/", "_").replace("\\", "_").strip()
+        return sanitized or f"{index:05d}"
+
+    def _write_interactive_pdf(
+        self,
+        form: _ReusableFormWriter,
+        payload: Dict[str, object],
+        output_path: Path,
     ) -> None:
         """Fill the PDF form fields while keeping them editable."""
-        template_bytes = template_path.read_bytes()
-        reader = PdfReader(io.BytesIO(template_bytes))
-        writer = PdfWriter()
-        for page in reader.pages:
-            writer.add_page(page)
+        form.reset()
+        writer = form.writer
 
         text_updates: Dict[str, object] = {}
         checkbox_updates: Dict[str, Any] = {}
@@ -172,52 +283,35 @@ class PdfEngine:
             else:
                 text_updates[field_name] = normalized
 
-        if text_updates:
-            for page in writer.pages:
-                writer.update_page_form_field_values(page, text_updates)
-
-        for page in writer.pages:
-            annotations_obj = page.get("/Annots")
-            if not annotations_obj:
-                continue
-            if hasattr(annotations_obj, "get_object"):
-                annotations_obj = annotations_obj.get_object()
-            if not annotations_obj:
-                continue
-            annotation_refs = list(annotations_obj)
-
-            if checkbox_updates:
-                for annotation_ref in annotation_refs:
-                    annotation = annotation_ref.get_object()
-                    field_name = annotation.get("/T")
-                    if not field_name or field_name not in checkbox_updates:
-                        continue
-                    resolved_state = self._resolve_checkbox_state(
-                        checkbox_updates[field_name], annotation
-                    )
-                    annotation.update(
-                        {
-                            NameObject("/V"): resolved_state,
-                            NameObject("/AS"): resolved_state,
-                        }
-                    )
-
-            if read_only:
-                for annotation_ref in annotation_refs:
-                    annotation = annotation_ref.get_object()
-                    flags = int(annotation.get("/Ff", 0))
-                    annotation.update({NameObject("/Ff"): NumberObject(flags | 1)})
-
-        acro_form_obj = writer._root_object.get(NameObject("/AcroForm"))
+        # Only the widgets a row names are visited; the form indexed them once per fill.
+        for field_name, value in text_updates.items():
+            # Same edits as PdfWriter.update_page_form_field_values, but recorded.
+            for annotation in form.widgets_by_name.get(field_name, ()):
+                if annotation.get("/FT") == "/Btn":
+                    form.set(annotation, _STATE_KEY, NameObject(value))
+                form.set(annotation, _VALUE_KEY, TextStringObject(value))
+            for parent in form.parents_by_name.get(field_name, ()):
+                form.set(parent, _VALUE_KEY, TextStringObject(value))
+
+        for field_name, value in checkbox_updates.items():
+            for annotation in form.widgets_by_name.get(field_name, ()):
+                resolved_state = self._resolve_checkbox_state(value, form.checkbox_states(annotation))
+                form.set(annotation, _VALUE_KEY, resolved_state)
+                form.set(annotation, _STATE_KEY, resolved_state)
+
+        acro_form_obj = writer._root_object.get(_ACRO_FORM_KEY)
         if acro_form_obj is None:
             acro_form = DictionaryObject()
-            writer._root_object.update({NameObject("/AcroForm"): acro_form})
+            form.set(writer._root_object, _ACRO_FORM_KEY, acro_form)
         else:
             acro_form = acro_form_obj.get_object() if hasattr(acro_form_obj, "get_object") else acro_form_obj
-        acro_form.update({NameObject("/NeedAppearances"): BooleanObject(True)})
+        form.set(acro_form, _NEED_APPEARANCES_KEY, BooleanObject(True))
 
-        with output_path.open("wb") as handle:
-            writer.write(handle)
+        # PyPDF2 writes object by object and asks for the position of each; serialize in
+        # memory and hand the file a single write.
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        output_path.write_bytes(buffer.getbuffer())
 
     @staticmethod
     def _normalize_payload_value(value: Any) -> tuple[str, Any]:
@@ -239,20 +333,8 @@ class PdfEngine:
         return "text", str(value)
 
     @staticmethod
-    def _resolve_checkbox_state(value: Any, annotation: DictionaryObject) -> NameObject:
-        """Resolve the correct checkbox state name."""
-        def _available_states() -> list[NameObject]:
-            ap = annotation.get("/AP")
-            if hasattr(ap, "get_object"):
-                ap = ap.get_object()
-            if isinstance(ap, DictionaryObject):
-                normal = ap.get("/N")
-                if hasattr(normal, "get_object"):
-                    normal = normal.get_object()
-                if isinstance(normal, DictionaryObject):
-                    return [state for state in normal.keys() if isinstance(state, NameObject)]
-            return []
-
+    def _resolve_checkbox_state(value: Any, states: Sequence[NameObject]) -> NameObject:
+        """Resolve the correct checkbox state name among the widget's appearance ``states``."""
         def _match_state(target: NameObject) -> NameObject | None:
             for state in states:
                 if state == target or state[1:].lower() == target[1:].lower():
@@ -261,19 +343,17 @@ class PdfEngine:
 
         def _first_on_state() -> NameObject | None:
             for state in states:
-                if state != NameObject("/Off"):
+                if state != _OFF_STATE:
                     return state
             return None
 
         def _first_off_state() -> NameObject | None:
             for state in states:
                 lowered = state[1:].lower() if len(state) > 1 else ""
-                if state == NameObject("/Off") or lowered in {"off", "no", "false", "unchecked", "0"}:
+                if state == _OFF_STATE or lowered in {"off", "no", "false", "unchecked", "0"}:
                     return state
             return None
 
-        states = _available_states()
-
         if isinstance(value, NameObject):
             match = _match_state(value)
             return match or value
@@ -285,14 +365,14 @@ class PdfEngine:
                 return match or target
             lowered = stripped.lower()
             if lowered in {"yes", "true", "on", "1", "checked"}:
-                target = NameObject("/Yes")
+                target = _YES_STATE
                 match = _match_state(target)
                 if match:
                     return match
                 fallback_on = _first_on_state()
                 return fallback_on or target
             if lowered in {"no", "false", "off", "0", "unchecked"}:
-                candidates = [NameObject("/Off")]
+                candidates = [_OFF_STATE]
                 if stripped:
                     candidates.append(NameObject(f"/{stripped}"))
                 for candidate in candidates:
@@ -300,101 +380,214 @@ class PdfEngine:
                     if match:
                         return match
                 fallback_off = _first_off_state()
-                return fallback_off or NameObject("/Off")
+                return fallback_off or _OFF_STATE
             if stripped:
                 target = NameObject(f"/{stripped}")
                 match = _match_state(target)
                 return match or target
-            return NameObject("/Off")
+            return _OFF_STATE
         if isinstance(value, bool):
-            target = NameObject("/Yes" if value else "/Off")
+            target = _YES_STATE if value else _OFF_STATE
             match = _match_state(target)
             if match:
                 return match
             return _first_on_state() if value else (_first_off_state() or target)
         if value:
-            target = NameObject("/Yes")
+            target = _YES_STATE
             match = _match_state(target)
             if match:
                 return match
             fallback = _first_on_state()
             return fallback or target
-        return _match_state(NameObject("/Off")) or NameObject("/Off")
+        return _match_state(_OFF_STATE) or _OFF_STATE
 
     def _write_flattened_pdf(
         self,
-        template_doc: fitz.Document | None,
-        template_path: Path,
+        flat_template: _FlattenedTemplate,
         payload: Dict[str, object],
         output_path: Path,
     ) -> None:
         """Render field values directly onto the PDF and remove form widgets."""
-        close_template_doc = False
-        src_doc = template_doc
-        if src_doc is None:
-            src_doc = fitz.open(template_path)
-            close_template_doc = True
-
-        working = fitz.open()
-        working.insert_pdf(src_doc)
-
-        for page_index in range(working.page_count):
-            page = working.load_page(page_index)
-            widgets = list(page.widgets() or [])
-            for widget in widgets:
-                field_name = widget.field_name
-                text = payload.get(field_name, "")
-                if isinstance(text, str) and text.startswith("/"):
-                    lowered = text.lower()
-                    if lowered in {"/off", "/no"}:
-                        text = ""
-                    else:
-                        text = "X"
-                elif isinstance(text, bool):
-                    text = "X" if text else ""
-                elif isinstance(text, str):
-                    lowered = text.strip().lower()
-                    if lowered in {"yes", "true", "on", "1", "checked"}:
-                        text = "X"
-                    elif lowered in {"no", "false", "off", "0", "unchecked"}:
-                        text = ""
-                    else:
-                        text = text.strip()
-                else:
-                    text = "" if text is None else str(text)
-                if text:
-                    point = fitz.Point(widget.rect.x0 + 2, widget.rect.y1 - 4)
-                    page.insert_text(
-                        point,
-                        text,
-                        fontname="helv",
-                        fontsize=11,
-                    )
-                page.delete_widget(widget)
+        # Every row starts from its own copy of the form-free skeleton.
+        working = fitz.open(stream=flat_template.skeleton, filetype="pdf")
+
+        pages: Dict[int, fitz.Page] = {}
+        for page_index, field_name, point in flat_template.slots:
+            text = self._flattened_text(payload.get(field_name, ""))
+            if not text:
+                continue
+            page = pages.get(page_index)
+            if page is None:
+                page = pages[page_index] = working.load_page(page_index)
+            page.insert_text(
+                point,
+                text,
+                fontname="helv",
+                fontsize=11,
+            )
+
+        working.save(output_path, garbage=1)
+        working.close()
+
+    @staticmethod
+    def _flattened_text(value: Any) -> str:
+        """Return the text drawn in place of a flattened field holding ``value``."""
+        if isinstance(value, str) and value.startswith("/"):
+            return "" if value.lower() in {"/off", "/no"} else "X"
+        if isinstance(value, bool):
+            return "X" if value else ""
+        if isinstance(value, str):
+            lowered = value.strip().lower()
+            if lowered in {"yes", "true", "on", "1", "checked"}:
+                return "X"
+            if lowered in {"no", "false", "off", "0", "unchecked"}:
+                return ""
+            return value.strip()
+        return "" if value is None else str(value)
+
 
+class _FlattenedTemplate:
+    """The template with its form removed, plus where each field's text is drawn.
+
+    Built once per fill so rows only insert their text instead of walking and deleting
+    the widgets again.
+    """
+
+    def __init__(self, template_bytes: bytes) -> None:
+        document = fitz.open(stream=template_bytes, filetype="pdf")
         try:
-            working.delete_pdf_form()
-        except AttributeError:
-            pass
+            self.slots: List[Tuple[int, str, fitz.Point]] = []
+            for page_index in range(document.page_count):
+                page = document.load_page(page_index)
+                for widget in list(page.widgets() or []):
+                    point = fitz.Point(widget.rect.x0 + 2, widget.rect.y1 - 4)
+                    self.slots.append((page_index, widget.field_name, point))
+                    page.delete_widget(widget)
 
-        working.save(output_path)
-        working.close()
+            # Drop the residual form and annotation entries in place; garbage collection then
+            # leaves the orphaned widget objects out.
+            _remove_key(document, document.pdf_catalog(), "AcroForm")
+            for page_index in range(document.page_count):
+                _remove_key(document, document.load_page(page_index).xref, "Annots")
+            self.skeleton = document.tobytes(garbage=1)
+        finally:
+            document.close()
 
-        if close_template_doc and src_doc is not None:
-            src_doc.close()
 
-        self._strip_acroform(output_path)
+_MISSING = object()
 
-    def _strip_acroform(self, pdf_path: Path) -> None:
-        """Remove residual AcroForm metadata from a PDF."""
-        reader = PdfReader(str(pdf_path))
-        writer = PdfWriter()
-        for page in reader.pages:
-            page.pop(NameObject("/Annots"), None)
-            writer.add_page(page)
 
-        root = writer._root_object  # type: ignore[attr-defined]
-        root.pop(NameObject("/AcroForm"), None)
+class _ReusableFormWriter:
+    """A template cloned into one writer that is refilled and rewritten for every row.
 
-        with pdf_path.open("wb") as handle:
-            writer.write(handle)
+    Edits go through ``set`` and are undone by ``reset``, so each output matches what a
+    freshly cloned writer would have produced without paying for the page clone per row.
+    """
+
+    def __init__(self, reader: PdfReader, read_only: bool = False) -> None:
+        self.writer = PdfWriter()
+        for page in reader.pages:
+            self.writer.add_page(page)
+        self._undo: List[Tuple[DictionaryObject, NameObject, Any]] = []
+        self._checkbox_states: Dict[int, List[NameObject]] = {}
+
+        self.widgets_by_name: Dict[str, List[DictionaryObject]] = {}
+        # Parent fields keyed by their own /T, once per kid whose /T differs from it.
+        self.parents_by_name: Dict[str, List[DictionaryObject]] = {}
+        for page in self.writer.pages:
+            annotations_obj = page.get("/Annots")
+            if not annotations_obj:
+                continue
+            if hasattr(annotations_obj, "get_object"):
+                annotations_obj = annotations_obj.get_object()
+            for annotation_ref in annotations_obj or ():
+                annotation = annotation_ref.get_object()
+                if read_only:
+                    # The same for every row, so applied once and never undone.
+                    flags = int(annotation.get("/Ff", 0))
+                    annotation[_FLAGS_KEY] = NumberObject(flags | 1)
+                field_name = annotation.get("/T")
+                if field_name:
+                    self.widgets_by_name.setdefault(str(field_name), []).append(annotation)
+                if "/Parent" in annotation:
+                    parent = annotation["/Parent"].get_object()
+                    parent_name = parent.get("/T")
+                    if parent_name is not None and parent_name != field_name:
+                        self.parents_by_name.setdefault(str(parent_name), []).append(parent)
+
+    def checkbox_states(self, annotation: DictionaryObject) -> List[NameObject]:
+        """Return the appearance state names of ``annotation``, read once per writer."""
+        # Rows never edit /AP, and the annotation objects live as long as the writer.
+        states = self._checkbox_states.get(id(annotation))
+        if states is None:
+            states = self._checkbox_states[id(annotation)] = _appearance_states(annotation)
+        return states
+
+    def set(self, obj: DictionaryObject, key: NameObject, value: Any) -> None:
+        """Set ``obj[key]``, remembering the previous value for ``reset``."""
+        self._undo.append((obj, key, obj.get(key, _MISSING)))
+        obj[key] = value
+
+    def reset(self) -> None:
+        """Restore every value changed since the last reset."""
+        for obj, key, original in reversed(self._undo):
+            if original is _MISSING:
+                del obj[key]
+            else:
+                obj[key] = original
+        self._undo.clear()
+
+
+def _appearance_states(annotation: DictionaryObject) -> List[NameObject]:
+    """Return the normal appearance state names defined for ``annotation``."""
+    ap = annotation.get("/AP")
+    if hasattr(ap, "get_object"):
+        ap = ap.get_object()
+    if isinstance(ap, DictionaryObject):
+        normal = ap.get("/N")
+        if hasattr(normal, "get_object"):
+            normal = normal.get_object()
+        if isinstance(normal, DictionaryObject):
+            return [state for state in normal.keys() if isinstance(state, NameObject)]
+    return []
+
+
+def _remove_key(document: fitz.Document, xref: int, key: str) -> None:
+    """Delete ``key`` from the dictionary object ``xref`` of ``document``."""
+    if document.xref_get_key(xref, key)[0] == "null":
+        return
+    # MuPDF only nulls keys out; strip the null entry so the key is gone from the output.
+    document.xref_set_key(xref, key, "null")
+    source = document.xref_object(xref, compressed=True)
+    document.update_object(xref, source.replace(f"/{key} null", "", 1))
+
+
+class _PresetFilenames:
+    """Filename builder that replays names resolved by the parent process."""
+
+    def __init__(self, names: Sequence[str]) -> None:
+        self._names = names
+
+    def __call__(self, row: Mapping[str, Any], index: int) -> str:
+        return self._names[index - 1]
+
+
+def _fill_rows_chunk(
+    template_path: Path,
+    destination_dir: Path,
+    rules: List[MappingRule],
+    rows: List[Mapping[str, Any]],
+    names: List[str],
+    flatten: bool,
+    read_only: bool,
+) -> List[Path]:
+    """Process-pool entry point for ``PdfEngine.fill_rows_parallel``."""
+    return PdfEngine().fill_rows(
+        template_path,
+        destination_dir,
+        rules,
+        rows,
+        filename_builder=_PresetFilenames(names),
+        flatten=flatten,
+        read_only=read_only,
+    )
@@ -2090,7 +2090,6 @@ class MainWindow(QtWidgets.QMainWindow):
             rows,
             flatten=flatten_output,
             read_only=read_only_choice,
-            template_metadata=self._state.pdf_template,
             mode=options.mode,
             combined_output=combined_path,
             filename_builder=builder,
@@ -2099,14 +2098,17 @@ class MainWindow(QtWidgets.QMainWindow):
         thread = QtCore.QThread(self)
         worker.moveToThread(thread)
 
-        worker.progress.connect(self._on_generation_progress)
-        worker.completed.connect(self._on_generation_completed)
-        worker.failed.connect(self._on_generation_failed)
-        worker.cancelled.connect(self._on_generation_cancelled)
+        # Worker signals cross into the GUI thread; request_cancel only sets a thread-safe event
+        # and must run immediately, not queue behind run() on the busy worker thread.
+        queued = QtCore.Qt.ConnectionType.QueuedConnection
+        worker.progress.connect(self._on_generation_progress, queued)
+        worker.completed.connect(self._on_generation_completed, queued)
+        worker.failed.connect(self._on_generation_failed, queued)
+        worker.cancelled.connect(self._on_generation_cancelled, queued)
 
         thread.started.connect(worker.run)
         thread.finished.connect(thread.deleteLater)
-        progress.canceled.connect(worker.request_cancel)
+        progress.canceled.connect(worker.request_cancel, QtCore.Qt.ConnectionType.DirectConnection)
 
         self._generation_thread = thread
         self._generation_worker = worker
@@ -2486,6 +2488,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.page_spinner.setEnabled(False)
             self._show_pdf_placeholder()
 
+    @QtCore.Slot(int, int)
     def _on_generation_progress(self, current: int, total: int) -> None:
         if not self._generation_progress:
             return
@@ -2493,13 +2496,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self._generation_progress.setValue(current)
         self._set_status(f"Generating PDFs... {current}/{total}", timeout=1500)
 
-    def _on_generation_completed(self, outputs: list[Path]) -> None:
+    @QtCore.Slot(int, str)
+    def _on_generation_completed(self, count: int, location: str) -> None:
         mode = getattr(self, "_last_generation_mode", "per_entry")
         target = getattr(self, "_last_generation_target", None)
         self._cleanup_generation_worker()
 
         if mode == "combined":
-            final_path = outputs[0] if outputs else target
+            final_path = location if count else target
             if final_path:
                 final_path = Path(final_path)
                 QtWidgets.QMessageBox.information(
@@ -2514,24 +2518,26 @@ class MainWindow(QtWidgets.QMainWindow):
                 self._last_generation_target = None
             return
 
-        destination = target or (outputs[0].parent if outputs else None)
+        destination = target or (location if count else None)
         if destination:
             QtWidgets.QMessageBox.information(
                 self,
                 "Generation Complete",
-                f"Created {len(outputs)} PDF files in {destination}.",
+                f"Created {count} PDF files in {destination}.",
             )
-            self._set_status(f"Created {len(outputs)} PDF files", timeout=6000)
+            self._set_status(f"Created {count} PDF files", timeout=6000)
             self._last_generation_target = None
         else:
             self._last_generation_target = None
 
+    @QtCore.Slot(str)
     def _on_generation_failed(self, message: str) -> None:
         self._cleanup_generation_worker()
         self._last_generation_target = None
         QtWidgets.QMessageBox.critical(self, "Generation Failed", message)
         self._set_status("PDF generation failed", timeout=6000)
 
+    @QtCore.Slot()
     def _on_generation_cancelled(self) -> None:
         self._cleanup_generation_worker()
         self._last_generation_target = None
@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+from contextlib import contextmanager
+import hashlib
+import pickle
+import sys
+import threading
+from typing import AbstractSet, Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+import weakref
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
@@ -28,6 +34,98 @@ RULE_HELP_TEXT: dict[RuleType, str] = {
     ),
 }
 
+_CHANGE_DEBOUNCE_MS = 50
+_ASYNC_PARSE_THRESHOLD = 64
+_GRAY_BRUSH = QtGui.QBrush(QtGui.QColor(QtCore.Qt.GlobalColor.gray))
+_CHECKBOX_TRUE_VALUES = frozenset({"yes", "true", "on", "1", "checked"})
+_CHECKBOX_FALSE_VALUES = frozenset({"no", "false", "off", "0", "unchecked"})
+_ACTION_KEYS = frozenset(
+    {"column", "fallback", "format", "value", "checked", "checked_value", "unchecked_value", "on", "off"}
+)
+
+# Parsed conditional cases keyed by a digest of their payload, stored pickled so every hit
+# returns an independent copy. Small rules parse faster than they round-trip.
+_PARSED_CASE_CACHE: Dict[str, bytes] = {}
+# Background parses and the GUI thread both read and write the cache.
+_PARSED_CASE_CACHE_LOCK = threading.Lock()
+_CASE_CACHE_MIN_SIZE = 32
+_CASE_CACHE_MAX_ENTRIES = 64
+
+# Text -> row lookups for combo boxes filled through ``_reset_combo``, paired with the items
+# they were built for; a changed item count (insertions made afterwards) invalidates them.
+_COMBO_TEXT_INDEX: weakref.WeakKeyDictionary[QtWidgets.QComboBox, tuple[tuple[str, ...], Dict[str, int]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _intern_names(names: Iterable[object]) -> list[str]:
+    """Return ``names`` as interned strings so widgets share one copy of each column/field name."""
+    return [sys.intern(name if isinstance(name, str) else str(name)) for name in names]
+
+
+def _as_str_list(value: object) -> list[str]:
+    """Return a list/tuple option as strings; any other shape counts as empty."""
+    if isinstance(value, (list, tuple)):
+        return [item if isinstance(item, str) else str(item) for item in value]
+    return []
+
+
+@contextmanager
+def _bulk_update(widget: QtWidgets.QWidget, *, block_signals: bool = True) -> Iterator[None]:
+    """Suspend repaints (and by default signals) on ``widget`` while it is repopulated."""
+    updates_enabled = widget.updatesEnabled()
+    widget.setUpdatesEnabled(False)
+    signals_blocked = widget.blockSignals(True) if block_signals else False
+    try:
+        yield
+    finally:
+        if block_signals:
+            widget.blockSignals(signals_blocked)
+        widget.setUpdatesEnabled(updates_enabled)
+
+
+def _resolve_mode(action: Mapping[str, Any]) -> str:
+    """Return the action's explicit mode (``mode``, ``kind`` or ``type``), lowercased."""
+    raw_mode = action.get("mode") or action.get("kind") or action.get("type")
+    if isinstance(raw_mode, str):
+        return raw_mode.lower()
+    return str(raw_mode or "").lower()
+
+
+def _reset_combo(combo: QtWidgets.QComboBox, items: Sequence[str], current: str) -> None:
+    """Replace the combo items and restore ``current`` when it is still available.
+
+    Unchanged item lists keep the existing rows and only restore the selection.
+    """
+    combo.blockSignals(True)
+    items = tuple(items)
+    cached = _COMBO_TEXT_INDEX.get(combo)
+    if cached is not None and cached[0] == items and len(items) == combo.count():
+        index = cached[1].get(current, -1)
+        combo.setCurrentIndex(index if index >= 0 else min(0, combo.count() - 1))
+        combo.blockSignals(False)
+        return
+    combo.clear()
+    combo.addItems(items)
+    lookup: Dict[str, int] = {}
+    for index, text in enumerate(items):
+        lookup.setdefault(text, index)
+    _COMBO_TEXT_INDEX[combo] = (items, lookup)
+    index = lookup.get(current, -1)
+    if index >= 0:
+        combo.setCurrentIndex(index)
+    combo.blockSignals(False)
+
+
+def _combo_index(combo: QtWidgets.QComboBox, text: str) -> int:
+    """Return the row holding ``text``, avoiding a linear ``findText`` scan when possible."""
+    cached = _COMBO_TEXT_INDEX.get(combo)
+    if cached is not None:
+        items, lookup = cached
+        if len(items) == combo.count():
+            return lookup.get(text, -1)
+    return combo.findText(text)
+
 
 class _AutoSizingStack(QtWidgets.QStackedWidget):
     """Stacked widget that resizes to the currently visible page."""
@@ -45,7 +143,73 @@ class _AutoSizingStack(QtWidgets.QStackedWidget):
         return super().minimumSizeHint()
 
 
-class _TargetsSelector(QtWidgets.QListWidget):
+class _CheckListModel(QtCore.QStringListModel):
+    """String list model whose rows are checkable; check state is kept per name."""
+
+    checkStateChanged = QtCore.Signal()
+
+    def __init__(self, parent: QtCore.QObject | None = None, *, movable: bool = False) -> None:
+        super().__init__(parent)
+        self._movable = movable
+        self._checked: set[str] = set()
+        self._available: AbstractSet[str] | None = None
+
+    def set_items(
+        self,
+        items: Sequence[str],
+        checked: Iterable[str],
+        available: AbstractSet[str] | None = None,
+    ) -> None:
+        """Show ``items``; names outside ``available`` are listed but disabled and grayed out."""
+        self._checked = set(checked)
+        self._available = available
+        if list(items) == self.stringList():
+            # Same rows: repaint the check states instead of resetting the views.
+            if items:
+                self.dataChanged.emit(self.index(0), self.index(len(items) - 1))
+            return
+        self.setStringList(list(items))
+
+    def checked_items(self) -> list[str]:
+        checked = self._checked
+        return [name for name in self.stringList() if name in checked]
+
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags:  # type: ignore[override]
+        if not index.isValid():
+            return QtCore.Qt.ItemIsDropEnabled if self._movable else QtCore.Qt.NoItemFlags
+        flags = QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsUserCheckable
+        if self._is_available(index):
+            flags |= QtCore.Qt.ItemIsEnabled
+            if self._movable:
+                flags |= QtCore.Qt.ItemIsDragEnabled
+        return flags
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole) -> Any:  # type: ignore[override]
+        if role == QtCore.Qt.CheckStateRole and index.isValid():
+            return QtCore.Qt.Checked if super().data(index) in self._checked else QtCore.Qt.Unchecked
+        if role == QtCore.Qt.ForegroundRole and index.isValid() and not self._is_available(index):
+            return _GRAY_BRUSH
+        return super().data(index, role)
+
+    def setData(self, index: QtCore.QModelIndex, value: Any, role: int = QtCore.Qt.EditRole) -> bool:  # type: ignore[override]
+        if role != QtCore.Qt.CheckStateRole:
+            return super().setData(index, value, role)
+        if not index.isValid():
+            return False
+        name = super().data(index)
+        if QtCore.Qt.CheckState(value) == QtCore.Qt.Checked:
+            self._checked.add(name)
+        else:
+            self._checked.discard(name)
+        self.dataChanged.emit(index, index, [QtCore.Qt.CheckStateRole])
+        self.checkStateChanged.emit()
+        return True
+
+    def _is_available(self, index: QtCore.QModelIndex) -> bool:
+        return self._available is None or super().data(index) in self._available
+
+
+class _TargetsSelector(QtWidgets.QListView):
     """Checkbox list for selecting PDF targets."""
 
     selectionChanged = QtCore.Signal()
@@ -53,30 +217,15 @@ class _TargetsSelector(QtWidgets.QListWidget):
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
         self.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
-        self.itemChanged.connect(lambda _item: self.selectionChanged.emit())
+        self._model = _CheckListModel(self)
+        self.setModel(self._model)
+        self._model.checkStateChanged.connect(self.selectionChanged.emit)
 
     def set_targets(self, targets: Sequence[str], selected: Iterable[str]) -> None:
-        existing = {item.text(): item for item in (self.item(i) for i in range(self.count()))}
-        selected_set = set(selected)
-        self.clear()
-        for target in targets:
-            item = existing.get(target, QtWidgets.QListWidgetItem(target))
-            item.setText(target)
-            item.setFlags(
-                QtCore.Qt.ItemIsEnabled
-                | QtCore.Qt.ItemIsUserCheckable
-                | QtCore.Qt.ItemIsSelectable
-            )
-            item.setCheckState(QtCore.Qt.Checked if target in selected_set else QtCore.Qt.Unchecked)
-            self.addItem(item)
+        self._model.set_items(_intern_names(targets), _intern_names(selected))
 
     def selected_targets(self) -> list[str]:
-        result: list[str] = []
-        for index in range(self.count()):
-            item = self.item(index)
-            if item.checkState() == QtCore.Qt.Checked:
-                result.append(item.text())
-        return result
+        return self._model.checked_items()
 
 
 class _ValueConfigWidget(QtWidgets.QWidget):
@@ -84,31 +233,24 @@ class _ValueConfigWidget(QtWidgets.QWidget):
 
     def __init__(self, columns: Sequence[str], parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
-        self._columns = list(columns)
+        self._columns = _intern_names(columns)
         self._column_combo = QtWidgets.QComboBox()
         self._default_edit = QtWidgets.QLineEdit()
         self._format_edit = QtWidgets.QLineEdit()
 
         layout = QtWidgets.QFormLayout(self)
-        self._column_combo.addItems(self._columns)
+        _reset_combo(self._column_combo, self._columns, "")
         layout.addRow("Source column:", self._column_combo)
         layout.addRow("Default value:", self._default_edit)
         layout.addRow("Format pattern:", self._format_edit)
 
     def set_columns(self, columns: Sequence[str]) -> None:
-        current = self._column_combo.currentText()
-        self._column_combo.blockSignals(True)
-        self._column_combo.clear()
-        self._column_combo.addItems(columns)
-        index = self._column_combo.findText(current)
-        if index >= 0:
-            self._column_combo.setCurrentIndex(index)
-        self._column_combo.blockSignals(False)
+        _reset_combo(self._column_combo, columns, self._column_combo.currentText())
 
     def load_options(self, options: Dict[str, str]) -> None:
         column_value = options.get("column")
         column = column_value if isinstance(column_value, str) else ""
-        index = self._column_combo.findText(column)
+        index = _combo_index(self._column_combo, column)
         if index >= 0:
             self._column_combo.setCurrentIndex(index)
         elif self._column_combo.count():
@@ -154,9 +296,12 @@ class _ConcatConfigWidget(QtWidgets.QWidget):
 
     def __init__(self, columns: Sequence[str], parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
-        self._columns = list(columns)
+        self._columns = _intern_names(columns)
+        self._available_columns = frozenset(self._columns)
 
-        self._column_list = QtWidgets.QListWidget()
+        self._column_model = _CheckListModel(self, movable=True)
+        self._column_list = QtWidgets.QListView()
+        self._column_list.setModel(self._column_model)
         self._column_list.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
         self._column_list.setDragDropMode(QtWidgets.QAbstractItemView.InternalMove)
         self._column_list.viewport().setAcceptDrops(True)
@@ -195,50 +340,21 @@ class _ConcatConfigWidget(QtWidgets.QWidget):
         layout.addWidget(settings_panel, 4)
 
     def _populate_columns(self, selected: Iterable[str] | None = None) -> None:
-        selected_list = [str(name) for name in selected or [] if name]
-        selected_seen: set[str] = set()
-        available_set = {str(column) for column in self._columns}
-
-        self._column_list.clear()
-
-        def _add_item(column_name: str, *, checked: bool, enabled: bool = True) -> None:
-            item = QtWidgets.QListWidgetItem(column_name)
-            flags = QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsUserCheckable
-            if enabled:
-                flags |= QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsDragEnabled
-            item.setFlags(flags)
-            item.setCheckState(QtCore.Qt.Checked if checked else QtCore.Qt.Unchecked)
-            if not enabled:
-                item.setForeground(QtGui.QColor(QtCore.Qt.GlobalColor.gray))
-            self._column_list.addItem(item)
-
-        # Preserve the user-defined ordering for selected columns first.
-        for column in selected_list:
-            if column in selected_seen:
-                continue
-            if column in available_set:
-                _add_item(column, checked=True, enabled=True)
-            else:
-                _add_item(column, checked=True, enabled=False)
-            selected_seen.add(column)
-
-        # Append the remaining available columns in their default order.
-        for column in self._columns:
-            if column in selected_seen:
-                continue
-            _add_item(column, checked=column in selected_seen, enabled=True)
+        # Selected columns keep their user-defined order, including ones no longer available;
+        # the remaining available columns follow in their default order.
+        items = list(dict.fromkeys(_intern_names(name for name in selected or [] if name)))
+        checked = set(items)
+        items.extend(column for column in self._columns if column not in checked)
+        self._column_model.set_items(items, checked, self._available_columns)
 
     def set_columns(self, columns: Sequence[str]) -> None:
         selected = self.selected_columns()
-        self._columns = list(columns)
+        self._columns = _intern_names(columns)
+        self._available_columns = frozenset(self._columns)
         self._populate_columns(selected)
 
     def load_options(self, options: Dict[str, object]) -> None:
-        columns = options.get("columns", [])
-        if isinstance(columns, list):
-            self._populate_columns(columns)
-        else:
-            self._populate_columns()
+        self._populate_columns(_as_str_list(options.get("columns")))
         self._separator_edit.setText(str(options.get("separator", ", ")))
         self._prefix_edit.setText(str(options.get("prefix", "")))
         self._suffix_edit.setText(str(options.get("suffix", "")))
@@ -254,12 +370,7 @@ class _ConcatConfigWidget(QtWidgets.QWidget):
         }
 
     def selected_columns(self) -> List[str]:
-        columns: List[str] = []
-        for index in range(self._column_list.count()):
-            item = self._column_list.item(index)
-            if item.checkState() == QtCore.Qt.Checked:
-                columns.append(item.text())
-        return columns
+        return self._column_model.checked_items()
 
 
 class _ChoiceTargetActionEditor(QtWidgets.QWidget):
@@ -267,13 +378,10 @@ class _ChoiceTargetActionEditor(QtWidgets.QWidget):
 
     changed = QtCore.Signal()
 
-    _CHECKBOX_TRUE_VALUES = {"yes", "true", "on", "1", "checked"}
-    _CHECKBOX_FALSE_VALUES = {"no", "false", "off", "0", "unchecked"}
-
     def __init__(self, target: str, columns: Sequence[str], parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
         self._target = target
-        self._columns = list(columns)
+        self._columns = _intern_names(columns)
         self._block_updates = False
         self.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
 
@@ -288,7 +396,7 @@ class _ChoiceTargetActionEditor(QtWidgets.QWidget):
         self._text_edit.setPlaceholderText("Enter the text to use")
 
         self._column_combo = QtWidgets.QComboBox()
-        self._column_combo.addItems(self._columns)
+        _reset_combo(self._column_combo, self._columns, "")
         self._column_combo.setEditable(False)
         self._column_combo.setSizeAdjustPolicy(QtWidgets.QComboBox.AdjustToContents)
         self._column_combo.setMinimumContentsLength(1)
@@ -332,15 +440,8 @@ class _ChoiceTargetActionEditor(QtWidgets.QWidget):
         self._on_mode_changed(self._mode_combo.currentIndex())
 
     def set_columns(self, columns: Sequence[str]) -> None:
-        current = self._column_combo.currentText()
-        self._columns = list(columns)
-        self._column_combo.blockSignals(True)
-        self._column_combo.clear()
-        self._column_combo.addItems(self._columns)
-        index = self._column_combo.findText(current)
-        if index >= 0:
-            self._column_combo.setCurrentIndex(index)
-        self._column_combo.blockSignals(False)
+        self._columns = _intern_names(columns)
+        _reset_combo(self._column_combo, self._columns, self._column_combo.currentText())
 
     def load_action(self, action: Any) -> None:
         self._block_updates = True
@@ -350,7 +451,7 @@ class _ChoiceTargetActionEditor(QtWidgets.QWidget):
         fallback = ""
 
         if isinstance(action, Mapping):
-            mode = str(action.get("mode") or action.get("kind") or action.get("type") or "").lower()
+            mode = _resolve_mode(action)
             if not mode:
                 if "column" in action:
                     mode = "column"
@@ -374,9 +475,9 @@ class _ChoiceTargetActionEditor(QtWidgets.QWidget):
         elif isinstance(action, str):
             normalized = action.strip()
             lowered = normalized.lower()
-            if lowered in self._CHECKBOX_TRUE_VALUES or normalized.startswith("/"):
+            if lowered in _CHECKBOX_TRUE_VALUES or normalized.startswith("/"):
                 mode = "checked"
-            elif lowered in self._CHECKBOX_FALSE_VALUES:
+            elif lowered in _CHECKBOX_FALSE_VALUES:
                 mode = "unchecked"
             else:
                 mode = "literal"
@@ -398,7 +499,7 @@ class _ChoiceTargetActionEditor(QtWidgets.QWidget):
         if mode == "column":
             self._column_combo.blockSignals(True)
             if column:
-                combo_index = self._column_combo.findText(column)
+                combo_index = _combo_index(self._column_combo, column)
                 if combo_index >= 0:
                     self._column_combo.setCurrentIndex(combo_index)
                 else:
@@ -453,6 +554,8 @@ class _ChoiceTargetActionEditor(QtWidgets.QWidget):
             self._emit_changed()
 
     def _emit_changed(self) -> None:
+        # Not debounced here: every target editor lives in a _ChoiceCaseEditor, which already
+        # coalesces its targets' changes behind one timer.
         if not self._block_updates:
             self.changed.emit()
 
@@ -472,10 +575,16 @@ class _ChoiceCaseEditor(QtWidgets.QWidget):
     ) -> None:
         super().__init__(parent)
         self._include_match_field = include_match_field
-        self._columns = list(columns)
-        self._targets = list(targets)
+        self._columns = _intern_names(columns)
+        self._targets = _intern_names(targets)
         self._block_updates = False
 
+        # Coalesce bursts of keystrokes into a single downstream ``changed`` emission.
+        self._changed_timer = QtCore.QTimer(self)
+        self._changed_timer.setSingleShot(True)
+        self._changed_timer.setInterval(_CHANGE_DEBOUNCE_MS)
+        self._changed_timer.timeout.connect(self.changed.emit)
+
         layout = QtWidgets.QFormLayout(self)
         layout.setFieldGrowthPolicy(QtWidgets.QFormLayout.ExpandingFieldsGrow)
         layout.setVerticalSpacing(6)
@@ -507,30 +616,36 @@ class _ChoiceCaseEditor(QtWidgets.QWidget):
         layout.addRow(self._targets_group)
 
     def set_columns(self, columns: Sequence[str]) -> None:
-        self._columns = list(columns)
+        self._columns = _intern_names(columns)
         for editor in self._target_editors.values():
             editor.set_columns(self._columns)
 
     def set_targets(self, targets: Sequence[str]) -> None:
-        stored_actions = self.actions()
-        self._targets = list(targets)
+        self._targets = _intern_names(targets)
         layout = self._targets_group.layout()
         assert isinstance(layout, QtWidgets.QFormLayout)
-        while layout.count():
-            item = layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-        self._target_editors = {}
-        for target in self._targets:
-            editor = _ChoiceTargetActionEditor(target, self._columns)
-            editor.changed.connect(self._emit_changed)
-            layout.addRow(f"{target}:", editor)
-            if target in stored_actions:
-                editor.load_action(stored_actions[target])
-            self._target_editors[target] = editor
+        previous = self._target_editors
+        wanted = frozenset(self._targets)
+        with _bulk_update(self._targets_group):
+            # Rows for fields that stay keep their editor (and its action); only the delta is
+            # rebuilt. removeRow disposes of both the label and the editor right away.
+            for target, editor in previous.items():
+                if target not in wanted:
+                    layout.removeRow(layout.getWidgetPosition(editor)[0])
+            self._target_editors = {}
+            for position, target in enumerate(self._targets):
+                editor = previous.get(target)
+                if editor is None:
+                    editor = _ChoiceTargetActionEditor(target, self._columns)
+                    editor.changed.connect(self._emit_changed)
+                    layout.insertRow(position, f"{target}:", editor)
+                elif layout.getWidgetPosition(editor)[0] != position:
+                    row = layout.takeRow(editor)
+                    layout.insertRow(position, row.labelItem.widget(), row.fieldItem.widget())
+                self._target_editors[target] = editor
 
     def load_case(self, case: Mapping[str, Any] | None) -> None:
+        self._changed_timer.stop()
         self._block_updates = True
         if self._match_edit is not None:
             value = ""
@@ -563,9 +678,76 @@ class _ChoiceCaseEditor(QtWidgets.QWidget):
     def clear(self) -> None:
         self.load_case(None)
 
+    def flush_pending(self) -> None:
+        """Emit a debounced change immediately so no trailing edit is lost."""
+        if self._changed_timer.isActive():
+            self._changed_timer.stop()
+            self.changed.emit()
+
     def _emit_changed(self) -> None:
         if not self._block_updates:
-            self.changed.emit()
+            self._changed_timer.start()
+
+
+class _ParseCasesSignals(QtCore.QObject):
+    finished = QtCore.Signal(int, object)
+
+
+class _ParseCasesRunnable(QtCore.QRunnable):
+    """Run a conditional rule's case parsing on a pool thread; ``done`` is set when it ends."""
+
+    def __init__(self, token: int, parse: Callable[[], list[Dict[str, Any]]]) -> None:
+        super().__init__()
+        self._token = token
+        self._parse = parse
+        self.signals = _ParseCasesSignals()
+        # The pool deletes the C++ runnable once ``run`` returns; hold ``lock`` and check
+        # ``done`` before touching it from another thread.
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+        self.result: list[Dict[str, Any]] | None = None
+
+    def run(self) -> None:
+        result = None
+        try:
+            result = self._parse()
+        finally:
+            with self.lock:
+                self.result = result
+                self.done.set()
+        self.signals.finished.emit(self._token, result)
+
+
+class _CaseListModel(QtCore.QAbstractListModel):
+    """List model over the conditional cases; labels are formatted on demand."""
+
+    def __init__(self, label_for: Callable[[Dict[str, Any]], str], parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._label_for = label_for
+        self.cases: list[Dict[str, Any]] = []
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self.cases)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole) -> Any:  # type: ignore[override]
+        if role == QtCore.Qt.DisplayRole and index.isValid():
+            return self._label_for(self.cases[index.row()])
+        return None
+
+    def refresh(self) -> None:
+        """Tell views to re-read every row after ``cases`` was replaced or reordered."""
+        self.beginResetModel()
+        self.endResetModel()
+
+    def append_case(self, case: Dict[str, Any]) -> None:
+        row = len(self.cases)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self.cases.append(case)
+        self.endInsertRows()
+
+    def case_changed(self, row: int) -> None:
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [QtCore.Qt.DisplayRole])
 
 
 class _ChoiceConfigWidget(QtWidgets.QWidget):
@@ -573,14 +755,39 @@ class _ChoiceConfigWidget(QtWidgets.QWidget):
 
     def __init__(self, columns: Sequence[str], targets: Sequence[str], parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
-        self._all_columns = list(columns)
-        self._targets = list(targets)
-        self._cases: list[Dict[str, Any]] = []
+        self._all_columns = _intern_names(columns)
+        self._targets = _intern_names(targets)
+        self._case_model = _CaseListModel(self._format_case_label, self)
         self._current_case_index = -1
         self._loading_case = False
+        # Set when the case editor has changes not yet written back to ``_cases``.
+        self._is_dirty = False
+        self._built = False
+        self._pending_options: Dict[str, object] | None = None
+        # Rules with many cases are parsed on the thread pool; the token discards stale results.
+        self._parse_token = 0
+        self._parse_job: _ParseCasesRunnable | None = None
+        self._parse_options: Mapping[str, object] | None = None
 
         self._source_combo = QtWidgets.QComboBox()
-        self._source_combo.addItems(self._all_columns)
+        _reset_combo(self._source_combo, self._all_columns, "")
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(8)
+        source_label = QtWidgets.QLabel("Source column:")
+        layout.addWidget(source_label)
+        layout.addWidget(self._source_combo)
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:  # type: ignore[override]
+        self._ensure_built()
+        super().showEvent(event)
+
+    def _ensure_built(self) -> None:
+        """Construct the case editors the first time the panel is shown or queried."""
+        if self._built:
+            return
+        self._built = True
 
         instructions = QtWidgets.QLabel(
             "Define how each value from the data column should toggle checkboxes or fill text fields."
@@ -588,19 +795,20 @@ class _ChoiceConfigWidget(QtWidgets.QWidget):
         instructions.setObjectName("choiceInstructions")
         instructions.setWordWrap(True)
 
-        self._cases_list = QtWidgets.QListWidget()
-        self._cases_list.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
-        self._cases_list.setUniformItemSizes(True)
-        self._cases_list.currentRowChanged.connect(self._on_case_selected)
+        self._cases_view = QtWidgets.QListView()
+        self._cases_view.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self._cases_view.setUniformItemSizes(True)
+        self._cases_view.setModel(self._case_model)
+        self._cases_view.selectionModel().currentRowChanged.connect(self._on_current_case_changed)
 
         self._case_editor = _ChoiceCaseEditor(self._all_columns, self._targets, include_match_field=True)
-        self._case_editor.changed.connect(self._on_case_changed)
+        self._case_editor.changed.connect(self._on_editor_changed)
 
         cases_panel = QtWidgets.QWidget()
         cases_layout = QtWidgets.QHBoxLayout(cases_panel)
         cases_layout.setContentsMargins(0, 0, 0, 0)
         cases_layout.setSpacing(8)
-        cases_layout.addWidget(self._cases_list, 2)
+        cases_layout.addWidget(self._cases_view, 2)
         cases_layout.addWidget(self._case_editor, 5)
         cases_panel.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.MinimumExpanding)
 
@@ -620,7 +828,6 @@ class _ChoiceConfigWidget(QtWidgets.QWidget):
             self._targets,
             include_match_field=False,
         )
-        self._fallback_editor.changed.connect(self._on_case_changed)
 
         fallback_group = QtWidgets.QGroupBox("When no value matches")
         fallback_group.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
@@ -642,55 +849,77 @@ class _ChoiceConfigWidget(QtWidgets.QWidget):
         scroll_layout.addWidget(fallback_group)
         scroll_layout.addStretch(1)
 
-        scroll_area = QtWidgets.QScrollArea()
-        scroll_area.setObjectName("choiceScrollArea")
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setFrameShape(QtWidgets.QFrame.NoFrame)
-        scroll_area.setWidget(scroll_content)
-
-        layout = QtWidgets.QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(8)
-        source_label = QtWidgets.QLabel("Source column:")
-        layout.addWidget(source_label)
-        layout.addWidget(self._source_combo)
-        layout.addWidget(scroll_area)
-
-        self._ensure_case_exists()
+        self._scroll_area = QtWidgets.QScrollArea()
+        self._scroll_area.setObjectName("choiceScrollArea")
+        self._scroll_area.setWidgetResizable(True)
+        self._scroll_area.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self._scroll_area.setWidget(scroll_content)
+        self.layout().addWidget(self._scroll_area)
+
+        pending = self._pending_options
+        self._pending_options = None
+        if pending is not None:
+            self._load_cases(pending)
+        else:
+            self._ensure_case_exists()
 
     def set_targets(self, targets: Sequence[str]) -> None:
+        targets = _intern_names(targets)
+        if targets == self._targets:
+            # Same fields (accept() re-sends them): keep the editor rows and only drop outputs
+            # that loaded cases still carry for other fields.
+            if self._built:
+                self._sync_current_case()
+                for row in self._prune_case_outputs():
+                    self._case_model.case_changed(row)
+            return
+        if not self._built:
+            self._targets = targets
+            return
         self._sync_current_case()
-        self._targets = list(targets)
-        for case in self._cases:
+        self._targets = targets
+        self._prune_case_outputs()
+        fallback_outputs = self._fallback_editor.actions()
+        # Both editors rebuild their target rows; repaint the panel once at the end. Selection
+        # signals stay live because the case list relies on them.
+        with _bulk_update(self._scroll_area, block_signals=False):
+            self._case_editor.set_targets(self._targets)
+            self._fallback_editor.set_targets(self._targets)
+            self._fallback_editor.load_case({"outputs": fallback_outputs})
+            self._refresh_case_list()
+            if 0 <= self._current_case_index < len(self._cases):
+                self._loading_case = True
+                self._case_editor.load_case(self._cases[self._current_case_index])
+                self._loading_case = False
+            elif self._cases:
+                self._select_case(0)
+
+    def _prune_case_outputs(self) -> List[int]:
+        """Drop case outputs for fields outside ``_targets``; return the rows that changed."""
+        targets_set = frozenset(self._targets)
+        changed: List[int] = []
+        for row, case in enumerate(self._cases):
             outputs = case.get("outputs", {})
             if isinstance(outputs, Mapping):
-                case["outputs"] = {key: outputs[key] for key in outputs if key in self._targets}
+                if outputs.keys() <= targets_set:
+                    continue
+                case["outputs"] = {key: value for key, value in outputs.items() if key in targets_set}
             else:
                 case["outputs"] = {}
-        fallback_outputs = self._fallback_editor.actions()
-        self._case_editor.set_targets(self._targets)
-        self._fallback_editor.set_targets(self._targets)
-        self._fallback_editor.load_case({"outputs": fallback_outputs})
-        self._refresh_case_list()
-        if 0 <= self._current_case_index < len(self._cases):
-            self._loading_case = True
-            self._case_editor.load_case(self._cases[self._current_case_index])
-            self._loading_case = False
-        elif self._cases:
-            self._cases_list.setCurrentRow(0)
+            case.pop("_simplified", None)
+            case.pop("_label", None)
+            changed.append(row)
+        return changed
 
     def set_columns(self, columns: Sequence[str]) -> None:
-        current = self._source_combo.currentText()
-        self._source_combo.blockSignals(True)
-        self._source_combo.clear()
-        self._source_combo.addItems(columns)
-        index = self._source_combo.findText(current)
-        if index >= 0:
-            self._source_combo.setCurrentIndex(index)
-        self._source_combo.blockSignals(False)
-        self._all_columns = list(columns)
-        self._case_editor.set_columns(self._all_columns)
-        self._fallback_editor.set_columns(self._all_columns)
+        self._all_columns = _intern_names(columns)
+        _reset_combo(self._source_combo, self._all_columns, self._source_combo.currentText())
+        if self._built:
+            self._case_editor.set_columns(self._all_columns)
+            self._fallback_editor.set_columns(self._all_columns)
+            # Column combos may have fallen back to another column without signalling; let the
+            # next sync store what the case editor now shows.
+            self._is_dirty = True
 
     def load_options(self, options: Dict[str, object], *, default_source: str | None = None) -> None:
         source_value = options.get("source")
@@ -698,7 +927,7 @@ class _ChoiceConfigWidget(QtWidgets.QWidget):
         if not source and default_source:
             source = default_source
         if source:
-            index = self._source_combo.findText(source)
+            index = _combo_index(self._source_combo, source)
             if index >= 0:
                 self._source_combo.setCurrentIndex(index)
             else:
@@ -707,86 +936,156 @@ class _ChoiceConfigWidget(QtWidgets.QWidget):
         elif self._source_combo.count() and self._source_combo.currentIndex() < 0:
             self._source_combo.setCurrentIndex(0)
 
+        if self._built:
+            self._load_cases(options)
+        else:
+            self._pending_options = options
+
+    def _load_cases(self, options: Mapping[str, object]) -> None:
+        self._parse_token += 1
+        if self._case_payload_size(options) > _ASYNC_PARSE_THRESHOLD:
+            self._parse_options = options
+            self._parse_job = _ParseCasesRunnable(self._parse_token, lambda: self._parse_cases(options))
+            self._parse_job.signals.finished.connect(self._on_cases_parsed)
+            self._scroll_area.setEnabled(False)
+            QtCore.QThreadPool.globalInstance().start(self._parse_job)
+            return
+        self._parse_job = None
+        self._parse_options = None
+        self._apply_cases(self._parse_cases(options), options)
+
+    @staticmethod
+    def _case_payload_size(options: Mapping[str, object]) -> int:
+        size = 0
+        for key in ("cases", "case_map"):
+            payload = options.get(key)
+            if isinstance(payload, (Mapping, list)):
+                size += len(payload)
+        return size
+
+    def _on_cases_parsed(self, token: int, parsed_cases: list[Dict[str, Any]]) -> None:
+        if token != self._parse_token or self._parse_options is None:
+            return
+        self._complete_parse(parsed_cases)
+
+    def _finish_pending_parse(self) -> None:
+        """Wait for a still-running background load so callers see the loaded cases."""
+        if self._parse_options is None:
+            return
+        job = self._parse_job
+        # The result is applied here, so drop the queued ``finished`` signal.
+        self._parse_token += 1
+        parsed_cases: list[Dict[str, Any]] | None = None
+        if job is not None:
+            with job.lock:
+                taken = not job.done.is_set() and QtCore.QThreadPool.globalInstance().tryTake(job)
+            if not taken:
+                # Already running (or finished): wait for it rather than parsing a second time.
+                job.done.wait()
+                parsed_cases = job.result
+        if parsed_cases is None:
+            # Never started (taken back off the queue) or the background parse failed.
+            parsed_cases = self._parse_cases(self._parse_options)
+        self._complete_parse(parsed_cases)
+
+    def _complete_parse(self, parsed_cases: list[Dict[str, Any]]) -> None:
+        options = self._parse_options
+        self._parse_job = None
+        self._parse_options = None
+        self._scroll_area.setEnabled(True)
+        self._apply_cases(parsed_cases, options or {})
+
+    def _parse_cases(self, options: Mapping[str, object]) -> list[Dict[str, Any]]:
+        """Turn a cases/case_map payload into editor cases; touches no widgets."""
+        if self._case_payload_size(options) < _CASE_CACHE_MIN_SIZE:
+            return self._parse_case_payload(options)
+        payload = repr((options.get("cases"), options.get("case_map")))
+        key = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+        with _PARSED_CASE_CACHE_LOCK:
+            cached = _PARSED_CASE_CACHE.get(key)
+        if cached is not None:
+            # Unpickling hands out fresh dicts, so edits never leak into the cache.
+            return pickle.loads(cached)
+        parsed_cases = self._parse_case_payload(options)
+        pickled = pickle.dumps(parsed_cases, protocol=pickle.HIGHEST_PROTOCOL)
+        with _PARSED_CASE_CACHE_LOCK:
+            if key not in _PARSED_CASE_CACHE and len(_PARSED_CASE_CACHE) >= _CASE_CACHE_MAX_ENTRIES:
+                _PARSED_CASE_CACHE.pop(next(iter(_PARSED_CASE_CACHE)))
+            _PARSED_CASE_CACHE[key] = pickled
+        return parsed_cases
+
+    def _parse_case_payload(self, options: Mapping[str, object]) -> list[Dict[str, Any]]:
         cases_payload = options.get("cases")
+        case_map = options.get("case_map")
+        if not isinstance(case_map, Mapping):
+            case_map = {}
+        normalize = self._normalize_outputs
+        if not cases_payload:
+            # Only the legacy map is present, so a single pass over it builds every case.
+            return [
+                {"match": str(match_value), "outputs": normalize(outputs)}
+                for match_value, outputs in case_map.items()
+            ]
         parsed_cases: list[Dict[str, Any]] = []
         if isinstance(cases_payload, Mapping):
-            for match_value, outputs in cases_payload.items():
-                parsed_cases.append(
-                    {
-                        "match": str(match_value),
-                        "outputs": self._normalize_outputs(outputs),
-                    }
-                )
+            parsed_cases = [
+                {"match": str(match_value), "outputs": normalize(outputs)}
+                for match_value, outputs in cases_payload.items()
+            ]
         elif isinstance(cases_payload, list):
-            for case in cases_payload:
-                if isinstance(case, Mapping):
-                    parsed_cases.append(
-                        {
-                            "match": str(case.get("match", "")),
-                            "outputs": self._normalize_outputs(case.get("outputs", {})),
-                        }
-                    )
-        elif not cases_payload:
-            case_map = options.get("case_map")
-            if isinstance(case_map, Mapping):
-                for match_value, outputs in case_map.items():
-                    parsed_cases.append(
-                        {
-                            "match": str(match_value),
-                            "outputs": self._normalize_outputs(outputs),
-                        }
-                    )
-        case_map = options.get("case_map")
-        if isinstance(case_map, Mapping) and case_map:
-            existing = [str(case.get("match", "")).strip() for case in parsed_cases]
-            blanks = [case for case in parsed_cases if not str(case.get("match", "")).strip()]
+            parsed_cases = [
+                {"match": str(case.get("match", "")), "outputs": normalize(case.get("outputs", {}))}
+                for case in cases_payload
+                if isinstance(case, Mapping)
+            ]
+        if case_map:
+            stripped = [str(case.get("match", "")).strip() for case in parsed_cases]
+            existing = set(stripped)
+            blanks = iter([case for case, match in zip(parsed_cases, stripped) if not match])
             for match_value, outputs in case_map.items():
                 key = str(match_value).strip()
-                if not key:
-                    continue
-                if key in existing:
+                if not key or key in existing:
                     continue
-                if blanks:
-                    slot = blanks.pop(0)
+                existing.add(key)
+                slot = next(blanks, None)
+                if slot is not None:
                     slot["match"] = key
-                    slot["outputs"] = self._normalize_outputs(outputs)
-                    existing.append(key)
+                    slot["outputs"] = normalize(outputs)
                 else:
-                    parsed_cases.append(
-                        {
-                            "match": key,
-                            "outputs": self._normalize_outputs(outputs),
-                        }
-                    )
-                    existing.append(key)
-        self._cases = parsed_cases or []
-        self._refresh_case_list()
-        if self._cases:
-            self._cases_list.setCurrentRow(0)
-        else:
-            self._ensure_case_exists()
+                    parsed_cases.append({"match": key, "outputs": normalize(outputs)})
+        return parsed_cases
+
+    def _apply_cases(self, parsed_cases: list[Dict[str, Any]], options: Mapping[str, object]) -> None:
+        with _bulk_update(self._scroll_area, block_signals=False):
+            self._case_model.cases = parsed_cases
+            # The editor still shows the previous case set; don't let the reselection write it back.
+            self._current_case_index = -1
+            self._refresh_case_list()
+            if self._cases:
+                self._select_case(0)
+            else:
+                self._ensure_case_exists()
 
-        default_payload = options.get("default", {})
-        if isinstance(default_payload, Mapping):
-            self._fallback_editor.load_case({"outputs": self._normalize_outputs(default_payload)})
-        else:
-            self._fallback_editor.clear()
+            default_payload = options.get("default", {})
+            if isinstance(default_payload, Mapping):
+                self._fallback_editor.load_case({"outputs": self._normalize_outputs(default_payload)})
+            else:
+                self._fallback_editor.clear()
 
     def build_options(self) -> Dict[str, object]:
+        self._ensure_built()
         self._sync_current_case()
-        cases_map: Dict[str, Dict[str, Any]] = {}
         cases_list: list[Dict[str, Any]] = []
         for case in self._cases:
             match_value = str(case.get("match", "")).strip()
             if not match_value:
                 continue
-            outputs: Dict[str, Any] = {}
-            for target, action in (case.get("outputs") or {}).items():
-                simplified = self._simplify_action(action)
-                if simplified is not None:
-                    outputs[str(target)] = simplified
+            # Copied so callers that edit the payload can't corrupt the memoized outputs.
+            outputs = {
+                target: dict(value) if isinstance(value, dict) else value
+                for target, value in self._simplified_outputs(case).items()
+            }
             cases_list.append({"match": match_value, "outputs": outputs})
-            cases_map[match_value] = outputs
 
         default_outputs: Dict[str, Any] = {}
         for target, action in self._fallback_editor.actions().items():
@@ -794,24 +1093,38 @@ class _ChoiceConfigWidget(QtWidgets.QWidget):
             if simplified is not None:
                 default_outputs[target] = simplified
 
+        # case_map is derived from the list when the rule is assigned (see MappingModel.assign).
         payload: Dict[str, object] = {
             "source": self._source_combo.currentText(),
+            "cases": cases_list,
         }
-        if cases_list:
-            payload["cases"] = cases_list
-            payload["case_map"] = cases_map
-        else:
-            payload["cases"] = {}
         if default_outputs:
             payload["default"] = default_outputs
         return payload
 
+    def _simplified_outputs(self, case: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the case's simplified outputs, memoized on the case dict.
+
+        Edits replace the case dict, so the memo only lives as long as the outputs it reflects;
+        ``_format_case_label`` memoizes the list label the same way.
+        """
+        cached = case.get("_simplified")
+        if cached is not None:
+            return cached
+        outputs: Dict[str, Any] = {}
+        for target, action in (case.get("outputs") or {}).items():
+            simplified = self._simplify_action(action)
+            if simplified is not None:
+                outputs[str(target)] = simplified
+        case["_simplified"] = outputs
+        return outputs
+
     def ensure_source_selected(self, preferred: str | None = None) -> None:
         if self._source_combo.currentIndex() >= 0 and self._source_combo.currentText():
             return
         candidate = preferred or ""
         if candidate:
-            index = self._source_combo.findText(candidate)
+            index = _combo_index(self._source_combo, candidate)
             if index >= 0:
                 self._source_combo.setCurrentIndex(index)
                 return
@@ -819,7 +1132,15 @@ class _ChoiceConfigWidget(QtWidgets.QWidget):
             self._source_combo.setCurrentIndex(0)
 
     def validate(self) -> tuple[bool, str | None]:
+        self._ensure_built()
         self._sync_current_case()
+
+        def missing_column(action: Any) -> bool:
+            if not isinstance(action, Mapping):
+                return False
+            mode = _resolve_mode(action) or ("column" if "column" in action else "")
+            return mode == "column" and not str(action.get("column", "")).strip()
+
         for case in self._cases:
             match_value = str(case.get("match", "")).strip()
             if not match_value:
@@ -828,46 +1149,51 @@ class _ChoiceConfigWidget(QtWidgets.QWidget):
             if not outputs:
                 return False, f"Add at least one field action for '{match_value}'."
             for target, action in outputs.items():
-                if isinstance(action, Mapping):
-                    mode = str(action.get("mode") or action.get("kind") or action.get("type") or "").lower()
-                    if not mode and "column" in action:
-                        mode = "column"
-                    if mode == "column" and not str(action.get("column", "")).strip():
-                        return False, f"Select a column for '{target}' when '{match_value}' is matched."
+                if missing_column(action):
+                    return False, f"Select a column for '{target}' when '{match_value}' is matched."
         for target, action in self._fallback_editor.actions().items():
-            if isinstance(action, Mapping):
-                mode = str(action.get("mode") or action.get("kind") or action.get("type") or "").lower()
-                if not mode and "column" in action:
-                    mode = "column"
-                if mode == "column" and not str(action.get("column", "")).strip():
-                    return False, f"Select a column for '{target}' in the fallback configuration."
+            if missing_column(action):
+                return False, f"Select a column for '{target}' in the fallback configuration."
         return True, None
 
     def _ensure_case_exists(self) -> None:
         if not self._cases:
             self._cases.append({"match": "", "outputs": {}})
             self._refresh_case_list()
-            self._cases_list.setCurrentRow(0)
+            self._select_case(0)
+
+    @property
+    def _cases(self) -> list[Dict[str, Any]]:
+        return self._case_model.cases
+
+    def _select_case(self, row: int) -> None:
+        self._cases_view.setCurrentIndex(self._case_model.index(row))
+
+    def _on_current_case_changed(self, current: QtCore.QModelIndex, _previous: QtCore.QModelIndex) -> None:
+        self._on_case_selected(current.row())
 
     def _refresh_case_list(self) -> None:
-        self._cases_list.blockSignals(True)
-        self._cases_list.clear()
-        for case in self._cases:
-            self._cases_list.addItem(self._format_case_label(case))
-        self._cases_list.blockSignals(False)
+        # A model reset drops the current row without emitting currentRowChanged.
+        self._case_model.refresh()
         if 0 <= self._current_case_index < len(self._cases):
-            self._cases_list.setCurrentRow(self._current_case_index)
+            self._select_case(self._current_case_index)
         else:
-            self._current_case_index = self._cases_list.currentRow()
+            self._current_case_index = self._cases_view.currentIndex().row()
 
-    def _format_case_label(self, case: Mapping[str, Any]) -> str:
+    def _format_case_label(self, case: Dict[str, Any]) -> str:
+        label = case.get("_label")
+        if label is not None:
+            return label
         match_value = str(case.get("match", "")).strip()
-        if match_value:
-            return match_value
         outputs = case.get("outputs", {})
-        if outputs:
-            return ", ".join(str(target) for target in outputs.keys())
-        return "New value"
+        if match_value:
+            label = match_value
+        elif outputs:
+            label = ", ".join(map(str, outputs))
+        else:
+            label = "New value"
+        case["_label"] = label
+        return label
 
     def _on_case_selected(self, index: int) -> None:
         if self._loading_case:
@@ -882,41 +1208,52 @@ class _ChoiceConfigWidget(QtWidgets.QWidget):
         else:
             self._case_editor.clear()
         self._loading_case = False
+        self._is_dirty = False
+
+    def _on_editor_changed(self) -> None:
+        self._is_dirty = True
+        self._on_case_changed()
 
     def _on_case_changed(self) -> None:
         if self._loading_case or not (0 <= self._current_case_index < len(self._cases)):
             return
         self._cases[self._current_case_index] = self._case_editor.case_data()
+        self._is_dirty = False
         self._update_case_label(self._current_case_index)
 
     def _update_case_label(self, index: int) -> None:
-        if 0 <= index < self._cases_list.count():
-            self._cases_list.item(index).setText(self._format_case_label(self._cases[index]))
+        if 0 <= index < len(self._cases):
+            self._case_model.case_changed(index)
 
     def _sync_current_case(self) -> None:
-        self._on_case_changed()
+        self._finish_pending_parse()
+        self._case_editor.flush_pending()
+        self._fallback_editor.flush_pending()
+        if self._is_dirty:
+            self._on_case_changed()
 
     def _handle_add_case(self) -> None:
         self._sync_current_case()
-        self._cases.append({"match": "", "outputs": {}})
-        self._refresh_case_list()
-        self._cases_list.setCurrentRow(len(self._cases) - 1)
+        # Appending leaves existing rows in place, so insert the one row instead of resetting.
+        self._case_model.append_case({"match": "", "outputs": {}})
+        self._select_case(len(self._cases) - 1)
 
     def _handle_remove_case(self) -> None:
-        index = self._cases_list.currentRow()
+        index = self._cases_view.currentIndex().row()
         if index < 0:
             return
         self._cases.pop(index)
         if not self._cases:
             self._cases.append({"match": "", "outputs": {}})
+        # The editor still shows the removed case; don't write it over the row that moved up.
+        self._current_case_index = -1
         self._refresh_case_list()
-        new_index = min(index, len(self._cases) - 1)
-        self._cases_list.setCurrentRow(new_index)
+        self._select_case(min(index, len(self._cases) - 1))
 
     def _simplify_action(self, action: Any) -> Any:
         if not isinstance(action, Mapping):
             return action
-        mode = str(action.get("mode") or action.get("kind") or action.get("type") or "").lower()
+        mode = _resolve_mode(action)
         if not mode and "column" in action:
             mode = "column"
         if not mode and "value" in action:
@@ -949,18 +1286,14 @@ class _ChoiceConfigWidget(QtWidgets.QWidget):
         return action
 
     def _normalize_outputs(self, payload: Any) -> Dict[str, Any]:
-        result: Dict[str, Any] = {}
-        if isinstance(payload, Mapping):
-            for key, value in payload.items():
-                spec = self._normalize_action(value)
-                if spec:
-                    result[str(key)] = spec
-        return result
+        if not isinstance(payload, Mapping):
+            return {}
+        return {str(key): spec for key, value in payload.items() if (spec := self._normalize_action(value))}
 
     def _normalize_action(self, value: Any) -> Dict[str, Any]:
         if isinstance(value, Mapping):
             data = dict(value)
-            mode = str(data.get("mode") or data.get("kind") or data.get("type") or "").lower()
+            mode = _resolve_mode(data)
             if not mode:
                 if "column" in data:
                     mode = "column"
@@ -969,18 +1302,18 @@ class _ChoiceConfigWidget(QtWidgets.QWidget):
                 elif "value" in data:
                     mode = "literal"
             result: Dict[str, Any] = {"mode": mode} if mode else {}
-            for key in ("column", "fallback", "format", "value", "checked", "checked_value", "unchecked_value", "on", "off"):
-                if key in data:
-                    result[key] = data[key]
+            for key, item in data.items():
+                if key in _ACTION_KEYS:
+                    result[key] = item
             return result
         if isinstance(value, bool):
             return {"mode": "checkbox", "checked": value}
         if isinstance(value, str):
             normalized = value.strip()
             lowered = normalized.lower()
-            if lowered in _ChoiceTargetActionEditor._CHECKBOX_TRUE_VALUES or normalized.startswith("/"):
+            if lowered in _CHECKBOX_TRUE_VALUES or normalized.startswith("/"):
                 return {"mode": "checkbox", "checked": True}
-            if lowered in _ChoiceTargetActionEditor._CHECKBOX_FALSE_VALUES:
+            if lowered in _CHECKBOX_FALSE_VALUES:
                 return {"mode": "checkbox", "checked": False}
             return {"mode": "literal", "value": value}
         if value is not None:
@@ -1004,8 +1337,8 @@ class RuleEditorDialog(QtWidgets.QDialog):
         self.resize(920, 560)
 
         self._field_name = field_name
-        self._available_fields = list(available_fields)
-        self._available_columns = list(available_columns)
+        self._available_fields = _intern_names(available_fields)
+        self._available_columns = _intern_names(available_columns)
         self._remove_callback = remove_callback
 
         self._types_combo = QtWidgets.QComboBox()
@@ -1019,33 +1352,25 @@ class RuleEditorDialog(QtWidgets.QDialog):
         self._targets_list.setMinimumWidth(220)
         self._targets_list.selectionChanged.connect(self._on_targets_changed)
 
-        self._value_widget = _ValueConfigWidget(self._available_columns)
-        self._literal_widget = _LiteralConfigWidget()
-        self._concat_widget = _ConcatConfigWidget(self._available_columns)
-        self._choice_widget = _ChoiceConfigWidget(self._available_columns, [])
+        # Rule panels are built the first time their type is shown; most edits touch only one.
+        self._widget_factories: Dict[RuleType, Callable[[], QtWidgets.QWidget]] = {
+            RuleType.VALUE: lambda: _ValueConfigWidget(self._available_columns),
+            RuleType.LITERAL: _LiteralConfigWidget,
+            RuleType.CHOICE: lambda: _ChoiceConfigWidget(self._available_columns, []),
+            RuleType.CONCAT: lambda: _ConcatConfigWidget(self._available_columns),
+        }
+        self._rule_widgets: Dict[RuleType, QtWidgets.QWidget] = {}
+        self._loaded_rule: MappingRule | None = None
+        self._help_rule_type: RuleType | None = None
 
         info_icon = self.style().standardIcon(QtWidgets.QStyle.SP_MessageBoxInformation)
         self._help_icon = QtWidgets.QLabel()
         pixmap = info_icon.pixmap(20, 20)
         self._help_icon.setPixmap(pixmap)
-        palette = self.palette()
-        highlight = palette.color(QtGui.QPalette.Highlight)
-        info_background = QtGui.QColor(highlight)
-        info_background.setAlpha(30)
-
-        self._help_icon.setAutoFillBackground(True)
-        icon_palette = self._help_icon.palette()
-        icon_palette.setColor(QtGui.QPalette.Window, info_background)
-        self._help_icon.setPalette(icon_palette)
-
-        frame = QtWidgets.QFrame()
-        frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
-        frame.setAutoFillBackground(True)
-        frame_palette = frame.palette()
-        frame_palette.setColor(QtGui.QPalette.Window, info_background)
-        frame_palette.setColor(QtGui.QPalette.WindowText, palette.color(QtGui.QPalette.WindowText))
-        frame.setPalette(frame_palette)
-        frame.setStyleSheet("QFrame { border: 1px solid palette(highlight); border-radius: 6px; }")
+        highlight = self.palette().color(QtGui.QPalette.Highlight)
+        self._help_icon.setStyleSheet(
+            f"QLabel {{ background-color: rgba({highlight.red()}, {highlight.green()}, {highlight.blue()}, 30); }}"
+        )
 
         self._help_label = QtWidgets.QLabel()
         self._help_label.setWordWrap(True)
@@ -1053,10 +1378,6 @@ class RuleEditorDialog(QtWidgets.QDialog):
         self._help_label.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft)
 
         self._stack = _AutoSizingStack()
-        self._stack.addWidget(self._value_widget)
-        self._stack.addWidget(self._literal_widget)
-        self._stack.addWidget(self._choice_widget)
-        self._stack.addWidget(self._concat_widget)
 
         self._types_combo.currentIndexChanged.connect(self._on_rule_type_changed)
 
@@ -1133,54 +1454,78 @@ class RuleEditorDialog(QtWidgets.QDialog):
         self.reject()
 
     def _load_rule(self, rule: MappingRule) -> None:
+        self._loaded_rule = rule
         selected_targets = rule.targets or [rule.name]
         self._targets_list.set_targets(self._available_fields, selected_targets)
+        for built_type, widget in self._rule_widgets.items():
+            self._prime_rule_widget(built_type, widget, rule)
 
         rule_type = rule.type_enum()
         index = self._types_combo.findData(rule_type)
         if index >= 0:
+            # The panel and help are switched below; don't run the type-change handler as well.
+            self._types_combo.blockSignals(True)
             self._types_combo.setCurrentIndex(index)
-
-        self._value_widget.set_columns(self._available_columns)
-        self._value_widget.load_options(rule.options)
-        self._literal_widget.load_options(rule.options)
-        self._concat_widget.set_columns(self._available_columns)
-        self._concat_widget.load_options(rule.options)
-        self._choice_widget.set_targets(selected_targets)
-        self._choice_widget.set_columns(self._available_columns)
-        preferred_source = ""
-        source_option = rule.options.get("source")
-        if isinstance(source_option, str):
-            preferred_source = source_option
-        else:
-            column_option = rule.options.get("column")
-            if isinstance(column_option, str):
-                preferred_source = column_option
-        if not preferred_source:
-            preferred_source = self._value_widget.current_column()
-        self._choice_widget.load_options(rule.options, default_source=preferred_source)
-        self._choice_widget.ensure_source_selected(preferred_source)
+            self._types_combo.blockSignals(False)
+        self._stack.setCurrentWidget(self._rule_widget(rule_type))
         self._update_help(rule_type)
 
+    def _rule_widget(self, rule_type: RuleType) -> QtWidgets.QWidget:
+        """Return the panel for ``rule_type``, building and loading it on first use."""
+        widget = self._rule_widgets.get(rule_type)
+        if widget is None:
+            widget = self._widget_factories[rule_type]()
+            self._rule_widgets[rule_type] = widget
+            self._stack.addWidget(widget)
+            if self._loaded_rule is not None:
+                self._prime_rule_widget(rule_type, widget, self._loaded_rule)
+        return widget
+
+    def _prime_rule_widget(self, rule_type: RuleType, widget: QtWidgets.QWidget, rule: MappingRule) -> None:
+        if rule_type is RuleType.VALUE or rule_type is RuleType.CONCAT:
+            widget.set_columns(self._available_columns)
+            widget.load_options(rule.options)
+        elif rule_type is RuleType.LITERAL:
+            widget.load_options(rule.options)
+        elif rule_type is RuleType.CHOICE:
+            widget.set_targets(rule.targets or [rule.name])
+            widget.set_columns(self._available_columns)
+            preferred_source = ""
+            source_option = rule.options.get("source")
+            if isinstance(source_option, str):
+                preferred_source = source_option
+            else:
+                column_option = rule.options.get("column")
+                if isinstance(column_option, str):
+                    preferred_source = column_option
+            if not preferred_source:
+                preferred_source = self._value_column()
+            widget.load_options(rule.options, default_source=preferred_source)
+            widget.ensure_source_selected(preferred_source)
+
+    def _value_column(self) -> str:
+        value_widget = self._rule_widgets.get(RuleType.VALUE)
+        if value_widget is not None:
+            return value_widget.current_column()
+        # An unbuilt value panel would show the first column.
+        return self._available_columns[0] if self._available_columns else ""
+
     def _on_targets_changed(self) -> None:
         targets = self._targets_list.selected_targets()
         if not targets:
             return
-        self._choice_widget.set_targets(targets)
+        choice_widget = self._rule_widgets.get(RuleType.CHOICE)
+        if choice_widget is not None:
+            choice_widget.set_targets(targets)
 
     def _on_rule_type_changed(self, index: int) -> None:
         data = self._types_combo.itemData(index)
         rule_type = self._coerce_rule_type(data)
-        if rule_type is RuleType.VALUE:
-            self._stack.setCurrentWidget(self._value_widget)
-        elif rule_type is RuleType.LITERAL:
-            self._stack.setCurrentWidget(self._literal_widget)
-        elif rule_type is RuleType.CHOICE:
-            self._stack.setCurrentWidget(self._choice_widget)
-            self._choice_widget.set_targets(self._targets_list.selected_targets() or [self._field_name])
-            self._choice_widget.ensure_source_selected(self._value_widget.current_column())
-        elif rule_type is RuleType.CONCAT:
-            self._stack.setCurrentWidget(self._concat_widget)
+        widget = self._rule_widget(rule_type)
+        self._stack.setCurrentWidget(widget)
+        if rule_type is RuleType.CHOICE:
+            widget.set_targets(self._targets_list.selected_targets() or [self._field_name])
+            widget.ensure_source_selected(self._value_column())
         self._update_help(rule_type)
 
     def selected_rule(self) -> MappingRule:
@@ -1197,25 +1542,17 @@ class RuleEditorDialog(QtWidgets.QDialog):
 
     def _gather_options(self, rule_type: RuleType, targets: Sequence[str]) -> Dict[str, object]:
         rule_type = self._coerce_rule_type(rule_type)
-        if rule_type is RuleType.VALUE:
-            return self._value_widget.build_options()
-        if rule_type is RuleType.LITERAL:
-            return self._literal_widget.build_options()
-        if rule_type is RuleType.CONCAT:
-            return self._concat_widget.build_options()
+        widget = self._rule_widgets.get(rule_type)
+        if widget is None:
+            return {}
         if rule_type is RuleType.CHOICE:
-            self._choice_widget.set_targets(targets)
-            return self._choice_widget.build_options()
-        return {}
+            widget.set_targets(targets)
+        return widget.build_options()
 
     def accept(self) -> None:
         targets = self._targets_list.selected_targets()
         if not targets:
-            QtWidgets.QMessageBox.warning(
-                self,
-                "Validate Rule",
-                "Select at least one PDF field to populate.",
-            )
+            self._warn("Select at least one PDF field to populate.")
             return
         data = self._types_combo.currentData()
         rule_type = self._coerce_rule_type(data)
@@ -1226,34 +1563,36 @@ class RuleEditorDialog(QtWidgets.QDialog):
 
     def _validate(self, rule_type: RuleType, options: Dict[str, object]) -> bool:
         rule_type = self._coerce_rule_type(rule_type)
+        warn = self._warn
         if rule_type is RuleType.VALUE:
             column = str(options.get("column", "")).strip()
             if not column:
-                QtWidgets.QMessageBox.warning(self, "Validate Rule", "Select a source column.")
+                warn("Select a source column.")
                 return False
         if rule_type is RuleType.CHOICE:
             source = str(options.get("source", "")).strip()
             if not source:
-                QtWidgets.QMessageBox.warning(self, "Validate Rule", "Select the source column for the conditional rule.")
+                warn("Select the source column for the conditional rule.")
                 return False
-            valid, message = self._choice_widget.validate()
+            valid, message = self._rule_widget(RuleType.CHOICE).validate()
             if not valid:
-                QtWidgets.QMessageBox.warning(
-                    self,
-                    "Validate Rule",
-                    message or "Configure at least one conditional value.",
-                )
+                warn(message or "Configure at least one conditional value.")
                 return False
         if rule_type is RuleType.CONCAT:
             columns = options.get("columns", [])
             if not columns:
-                QtWidgets.QMessageBox.warning(self, "Validate Rule", "Select at least one column to concatenate.")
+                warn("Select at least one column to concatenate.")
                 return False
         return True
 
+    def _warn(self, message: str) -> None:
+        QtWidgets.QMessageBox.warning(self, "Validate Rule", message)
+
     def _update_help(self, rule_type: RuleType) -> None:
-        text = RULE_HELP_TEXT.get(rule_type, "")
-        self._help_label.setText(text)
+        if rule_type is self._help_rule_type:
+            return
+        self._help_rule_type = rule_type
+        self._help_label.setText(RULE_HELP_TEXT.get(rule_type, ""))
 
     @staticmethod
     def _coerce_rule_type(data: object) -> RuleType:
@@ -2,25 +2,57 @@
 
 from __future__ import annotations
 
+import io
+import operator
 from pathlib import Path
 import tempfile
+import threading
+import time
 from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
 
 from PySide6 import QtCore
 
 import fitz
 from PyPDF2 import PdfReader, PdfWriter
-from PyPDF2.generic import BooleanObject, DictionaryObject, NameObject, NumberObject, TextStringObject
+from PyPDF2.generic import (
+    BooleanObject,
+    DictionaryObject,
+    IndirectObject,
+    NameObject,
+    NumberObject,
+    TextStringObject,
+)
 
-from pdf_bulk_filler.pdf.engine import PdfEngine, PdfTemplate
-from pdf_bulk_filler.mapping.rules import coerce_rules
+from pdf_bulk_filler.pdf.engine import PdfEngine
+from pdf_bulk_filler.mapping.rules import MappingRule, coerce_rules
+
+_PROGRESS_INTERVAL_NS = 50_000_000
+
+_ACRO_FORM_KEY = NameObject("/AcroForm")
+_NEED_APPEARANCES_KEY = NameObject("/NeedAppearances")
+_TITLE_KEY = NameObject("/T")
+_FLAGS_KEY = NameObject("/Ff")
+
+
+def _deref(obj: Any) -> Any:
+    """Resolve ``obj`` if it is an indirect reference, otherwise return it unchanged."""
+    return obj.get_object() if obj.__class__ is IndirectObject else obj
+
+
+class _GenerationCancelled(Exception):
+    """Raised inside the worker once the cancel event has been observed."""
 
 
 class PdfGenerationWorker(QtCore.QObject):
-    """Run PDF generation in a background thread."""
+    """Run PDF generation in a background thread.
+
+    Connect the result signals with ``Qt.QueuedConnection`` and ``request_cancel`` with
+    ``Qt.DirectConnection``: the worker thread is busy inside ``run`` until generation ends.
+    """
 
     progress = QtCore.Signal(int, int)
-    completed = QtCore.Signal(list)
+    # Output count and location (the output directory, or the combined PDF); see ``outputs``.
+    completed = QtCore.Signal(int, str)
     failed = QtCore.Signal(str)
     cancelled = QtCore.Signal()
 
@@ -34,7 +66,6 @@ class PdfGenerationWorker(QtCore.QObject):
         *,
         flatten: bool = False,
         read_only: bool = False,
-        template_metadata: PdfTemplate | None = None,
         mode: str = "per_entry",
         combined_output: Path | None = None,
         filename_builder: Optional[Callable[[Mapping[str, Any], int], str]] = None,
@@ -44,55 +75,95 @@ class PdfGenerationWorker(QtCore.QObject):
         self._engine = engine
         self._template_path = template_path
         self._output_dir = output_dir
-        self._rules = coerce_rules(rule_spec)
-        self._rows = list(rows)
+        # Coerced in run() so large rule sets don't block the GUI thread that builds the worker.
+        self._rule_spec = rule_spec
+        self._rules: List[MappingRule] = []
+        # Rows are streamed to the engine; the total is their length hint (0 when unknown).
+        self._rows = rows
+        self._total_rows = operator.length_hint(rows, 0)
         self._flatten = flatten
         self._read_only = read_only
-        self._template_metadata = template_metadata
-        self._cancel_requested = False
+        self._cancel_event = threading.Event()
         self._mode = "combined" if mode == "combined" else "per_entry"
         self._combined_output = combined_output
         self._filename_builder = filename_builder
+        self._outputs: List[Path] = []
 
     @QtCore.Slot()
     def run(self) -> None:
         try:
+            self._rules = coerce_rules(self._rule_spec)
             if self._mode == "combined":
                 outputs = self._generate_combined()
             else:
                 outputs = self._generate_individual()
-        except KeyboardInterrupt:
+        except _GenerationCancelled:
             self.cancelled.emit()
         except Exception as exc:  # noqa: BLE001
             self.failed.emit(str(exc))
         else:
-            self.completed.emit(outputs)
+            self._outputs = outputs
+            location = outputs[0] if self._mode == "combined" and outputs else self._output_dir
+            self.completed.emit(len(outputs), str(location))
 
+    @property
+    def outputs(self) -> List[Path]:
+        """Paths written by the last successful run."""
+        return self._outputs
+
+    @QtCore.Slot()
     def request_cancel(self) -> None:
         """Signal that the worker should abort as soon as possible."""
-        self._cancel_requested = True
+        self._cancel_event.set()
+
+    def _check_cancelled(self) -> None:
+        if self._cancel_event.is_set():
+            raise _GenerationCancelled
+
+    def _progress_reporter(self) -> Callable[[int, int], None]:
+        # Coalesce updates so large jobs don't flood the GUI thread with queued signals. The
+        # callback runs once per row, so everything it needs is bound as closure locals.
+        emit = self.progress.emit
+        fallback_total = self._total_rows
+        monotonic_ns = time.monotonic_ns
+        last_ns = 0
+        last_current = -1
+
+        def report(current: int, total: int) -> None:
+            nonlocal last_ns, last_current
+            total = total or fallback_total
+            now = monotonic_ns()
+            if (
+                current != total
+                and now - last_ns < _PROGRESS_INTERVAL_NS
+                and (not total or current - last_current < max(1, total // 100))
+            ):
+                return
+            last_ns = now
+            last_current = current
+            emit(current, total)
 
-    def _report_progress(self, current: int, _: int) -> None:
-        if self._cancel_requested:
-            raise KeyboardInterrupt
-        self.progress.emit(current, len(self._rows))
+        return report
 
     def _generate_individual(self) -> List[Path]:
         destination = self._output_dir
         destination.mkdir(parents=True, exist_ok=True)
-        outputs = self._engine.fill_rows(
+        outputs = self._engine.fill_rows_parallel(
             self._template_path,
             destination,
             self._rules,
             self._rows,
             filename_builder=self._filename_builder,
-            progress_callback=self._report_progress,
+            progress_callback=self._progress_reporter(),
             flatten=self._flatten,
-            template_metadata=self._template_metadata,
             read_only=self._read_only,
+            cancel_event=self._cancel_event,
         )
-        for path in outputs:
-            self._refresh_widget_appearances(path)
+        self._check_cancelled()
+        if not self._flatten:
+            # Flattened entries have no widgets left, so there is nothing to regenerate.
+            for path in outputs:
+                self._refresh_widget_appearances(path)
         return outputs
 
     def _generate_combined(self) -> List[Path]:
@@ -103,32 +174,35 @@ class PdfGenerationWorker(QtCore.QObject):
 
         with tempfile.TemporaryDirectory() as tmpdir:
             temp_dir = Path(tmpdir)
-            outputs = self._engine.fill_rows(
+            outputs = self._engine.fill_rows_parallel(
                 self._template_path,
                 temp_dir,
                 self._rules,
                 self._rows,
                 filename_builder=self._filename_builder,
-                progress_callback=self._report_progress,
+                progress_callback=self._progress_reporter(),
                 flatten=self._flatten,
-                template_metadata=self._template_metadata,
                 read_only=self._read_only,
+                cancel_event=self._cancel_event,
             )
 
+            self._check_cancelled()
             combined_writer = PdfWriter()
+            # A single entry cannot clash with anything, so its field names are kept as-is.
+            needs_rename = len(outputs) > 1
+            read_only = self._read_only
             for index, pdf_path in enumerate(outputs, start=1):
-                suffix = f"entry{index:04d}"
-                with pdf_path.open("rb") as input_handle:
-                    reader = PdfReader(input_handle)
-                    self._rename_form_fields(reader, suffix)
-                    if self._read_only:
-                        self._set_read_only(reader)
-                    combined_writer.append_pages_from_reader(reader)
-
-        acro_ref = combined_writer._root_object.get(NameObject("/AcroForm"))  # type: ignore[attr-defined]
+                # Read each entry once and parse it from memory; the scratch file is no longer needed.
+                reader = PdfReader(io.BytesIO(pdf_path.read_bytes()), strict=False)
+                pdf_path.unlink()
+                if needs_rename or read_only:
+                    suffix = f"entry{index:04d}" if needs_rename else None
+                    self._prepare_reader_for_append(reader, suffix, read_only)
+                combined_writer.append_pages_from_reader(reader)
+
+        acro_ref = combined_writer._root_object.get(_ACRO_FORM_KEY)  # type: ignore[attr-defined]
         if acro_ref is not None:
-            acro_form = acro_ref.get_object() if hasattr(acro_ref, "get_object") else acro_ref
-            acro_form.update({NameObject("/NeedAppearances"): BooleanObject(True)})
+            _deref(acro_ref)[_NEED_APPEARANCES_KEY] = BooleanObject(True)
 
         with final_path.open("wb") as output_handle:
             combined_writer.write(output_handle)
@@ -136,28 +210,18 @@ class PdfGenerationWorker(QtCore.QObject):
         self._refresh_widget_appearances(final_path)
         return [final_path]
 
-    def _set_read_only(self, reader: PdfReader) -> None:
-        for page in reader.pages:
-            annotations = page.get("/Annots")
-            if not annotations:
-                continue
-            annots = annotations.get_object() if hasattr(annotations, "get_object") else annotations
-            for annot_ref in list(annots):
-                annot = annot_ref.get_object()
-                flags = int(annot.get("/Ff", 0))
-                annot[NameObject("/Ff")] = NumberObject(flags | 1)
-
     def _refresh_widget_appearances(self, pdf_path: Path) -> None:
         document = fitz.open(pdf_path)
         try:
             for page_index in range(document.page_count):
                 page = document.load_page(page_index)
-                for widget in page.widgets() or []:
+                # Widget appearances live in their own XObjects; the page content stream is
+                # never touched here, so it is not re-cleaned.
+                for widget in page.widgets() or ():
                     try:
                         widget.update()
                     except Exception:  # noqa: BLE001
                         continue
-                page.clean_contents()
             temp_path = pdf_path.with_suffix(".tmp.pdf")
             document.save(temp_path, garbage=3, deflate=True)
         finally:
@@ -165,56 +229,61 @@ class PdfGenerationWorker(QtCore.QObject):
 
         temp_path.replace(pdf_path)
 
-    def _rename_form_fields(self, reader: PdfReader, suffix: str) -> None:
-        field_map: Dict[str, str] = {}
+    def _prepare_reader_for_append(
+        self, reader: PdfReader, suffix: Optional[str], read_only: bool
+    ) -> None:
+        """Suffix every field name and optionally flag fields read-only in one sweep.
 
-        def _rename_field(field_obj: Any) -> None:
-            if field_obj is None:
-                return
-            if hasattr(field_obj, "get_object"):
-                field_obj = field_obj.get_object()
-            if not isinstance(field_obj, dict):
-                return
+        Names are left untouched when ``suffix`` is ``None``.
+        """
+        new_names: Dict[str, str] = {}
+        # Merged field/widget dictionaries are reached from both the field tree and the page
+        # annotations; rename each object once. Only the dictionaries change, never the
+        # /Fields, /Kids or /Annots arrays, so those are iterated in place.
+        renamed: set[int] = set()
 
-            original = field_obj.get("/T")
-            if original:
-                original_text = str(original)
-                new_name = f"{original_text}_{suffix}"
-                field_obj[NameObject("/T")] = TextStringObject(new_name)
-                field_map[original_text] = new_name
+        def _rename(obj: DictionaryObject) -> None:
+            original = obj.get("/T")
+            if suffix is None or not original or id(obj) in renamed:
+                return
+            name = str(original)
+            new_name = new_names.get(name)
+            if new_name is None:
+                new_name = new_names[name] = f"{name}_{suffix}"
+            obj[_TITLE_KEY] = TextStringObject(new_name)
+            renamed.add(id(obj))
 
-            kids = field_obj.get("/Kids")
-            if kids:
-                for kid in kids:
-                    _rename_field(kid)
+        def _flag(obj: DictionaryObject) -> None:
+            obj[_FLAGS_KEY] = NumberObject(int(obj.get("/Ff", 0)) | 1)
 
-        acro_ref = reader.trailer["/Root"].get("/AcroForm")
+        acro_ref = reader.trailer["/Root"].get(_ACRO_FORM_KEY)
         if acro_ref is not None:
-            acro_form = acro_ref.get_object() if hasattr(acro_ref, "get_object") else acro_ref
-            fields = acro_form.get("/Fields")
-            if fields:
-                for field in list(fields):
-                    _rename_field(field)
-            acro_form.update({NameObject("/NeedAppearances"): BooleanObject(True)})
+            acro_form = _deref(acro_ref)
+            stack = list(acro_form.get("/Fields") or ())
+            while stack:
+                field_obj = _deref(stack.pop())
+                if not isinstance(field_obj, dict):
+                    continue
+                _rename(field_obj)
+                kids = field_obj.get("/Kids")
+                if kids and any("/T" in _deref(kid) for kid in kids):
+                    stack.extend(kids)
+                elif read_only:
+                    # /Ff is inheritable, so flagging the terminal field covers its widget kids.
+                    _flag(field_obj)
+            acro_form[_NEED_APPEARANCES_KEY] = BooleanObject(True)
 
         for page in reader.pages:
             annotations = page.get("/Annots")
             if not annotations:
                 continue
-            annots = annotations.get_object() if hasattr(annotations, "get_object") else annotations
-            for annot_ref in list(annots):
-                annot = annot_ref.get_object()
-                field_name = annot.get("/T")
-                if not field_name:
+            for annot_ref in _deref(annotations):
+                annot = _deref(annot_ref)
+                if id(annot) in renamed:
                     continue
-
-                name_str = str(field_name)
-                new_name = field_map.get(name_str)
-                if not new_name:
-                    new_name = f"{name_str}_{suffix}"
-                    field_map[name_str] = new_name
-                annot[NameObject("/T")] = TextStringObject(new_name)
-
-                if self._read_only:
-                    flags = int(annot.get("/Ff", 0))
-                    annot[NameObject("/Ff")] = NumberObject(flags | 1)
+                if annot.get("/T"):
+                    _rename(annot)
+                    if read_only:
+                        _flag(annot)
+                elif read_only and acro_ref is None:
+                    _flag(annot)
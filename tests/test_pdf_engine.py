@@ -1,6 +1,10 @@
 from pathlib import Path
+import subprocess
+import sys
+import threading
 
 import fitz
+import pytest
 from PyPDF2 import PdfReader, PdfWriter
 from PyPDF2.generic import (
     ArrayObject,
@@ -12,6 +16,7 @@ from PyPDF2.generic import (
     TextStringObject,
 )
 
+from pdf_bulk_filler.pdf import engine as engine_module
 from pdf_bulk_filler.pdf.engine import PdfEngine
 
 
@@ -126,3 +131,118 @@ def test_fill_rows_checkbox_states(tmp_path):
         acro_form = acro_form.get_object()
     if acro_form is not None:
         assert bool(acro_form.get("/NeedAppearances", False))
+
+
+def test_fill_rows_stops_when_cancel_event_set(tmp_path):
+    template_path = tmp_path / "checkbox.pdf"
+    _create_checkbox_template(template_path)
+
+    engine = PdfEngine()
+    cancel_event = threading.Event()
+    rows = [{"Agree": "/Yes", "id": str(index)} for index in range(3)]
+
+    def _cancel_after_first(current, total):
+        cancel_event.set()
+
+    outputs = engine.fill_rows(
+        template_path,
+        tmp_path / "out",
+        {"Agree": "Agree"},
+        rows,
+        progress_callback=_cancel_after_first,
+        cancel_event=cancel_event,
+    )
+
+    assert len(outputs) == 1
+    assert outputs[0].exists()
+
+
+def test_fill_rows_parallel_matches_serial_names(tmp_path, monkeypatch):
+    monkeypatch.setattr(engine_module, "_PARALLEL_MIN_ROWS", 1)
+    template_path = tmp_path / "checkbox.pdf"
+    _create_checkbox_template(template_path)
+
+    engine = PdfEngine()
+    rows = [{"Agree": "/Yes" if index % 2 else "/Off", "id": "dup"} for index in range(6)]
+    seen: dict[str, int] = {}
+
+    def _builder(row, index):
+        count = seen.get(row["id"], 0)
+        seen[row["id"]] = count + 1
+        return f"{row['id']}_{count}"
+
+    progress = []
+    outputs = engine.fill_rows_parallel(
+        template_path,
+        tmp_path / "out",
+        {"Agree": "Agree"},
+        rows,
+        filename_builder=_builder,
+        progress_callback=lambda current, total: progress.append((current, total)),
+        max_workers=2,
+    )
+
+    assert [path.name for path in outputs] == [f"dup_{index}.pdf" for index in range(6)]
+    states = [str(PdfReader(str(path)).pages[0]["/Annots"][0].get_object().get("/V")) for path in outputs]
+    assert states == ["/Off", "/Yes", "/Off", "/Yes", "/Off", "/Yes"]
+    assert progress[-1] == (6, 6)
+
+
+def test_fill_rows_flatten_renders_every_row(tmp_path):
+    engine = PdfEngine()
+    template_path = Path("assets/templates/sample_invoice.pdf").resolve()
+    rows = [
+        {"FullName": "Alice Example", "id": "1"},
+        {"FullName": "Bob Example", "id": "2"},
+    ]
+
+    outputs = engine.fill_rows(template_path, tmp_path, {"full_name": "FullName"}, rows, flatten=True)
+
+    for output_path, row in zip(outputs, rows):
+        doc = fitz.open(output_path)
+        try:
+            assert row["FullName"] in doc.load_page(0).get_text()
+        finally:
+            doc.close()
+
+
+def test_fill_rows_interactive_rows_keep_their_own_values(tmp_path):
+    engine = PdfEngine()
+    template_path = Path("assets/templates/sample_invoice.pdf").resolve()
+    rows = [
+        {"FullName": "Alice Example", "id": "1"},
+        {"FullName": "Bob Example", "id": "2"},
+    ]
+
+    outputs = engine.fill_rows(template_path, tmp_path, {"full_name": "FullName"}, rows, read_only=True)
+
+    for output_path, row in zip(outputs, rows):
+        annotations = [ref.get_object() for ref in PdfReader(str(output_path)).pages[0]["/Annots"]]
+        values = {str(annotation["/T"]): annotation.get("/V") for annotation in annotations}
+        assert values["full_name"] == row["FullName"]
+        assert all(int(annotation["/Ff"]) == 1 for annotation in annotations)
+
+
+@pytest.mark.parametrize("module", ["pdf_bulk_filler.pdf.engine", "pdf_bulk_filler.main"])
+def test_worker_imports_do_not_load_qt(module):
+    # Process-pool workers import the engine and re-import the entry point module; they must
+    # not pay for the GUI stack.
+    code = (
+        f"import sys, {module}; "
+        "sys.exit(any(name.split('.')[0] in {'PySide6', 'qfluentwidgets'} for name in sys.modules))"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+def test_fill_rows_parallel_reports_chunk_failure(tmp_path, monkeypatch):
+    monkeypatch.setattr(engine_module, "_PARALLEL_MIN_ROWS", 1)
+    rows = [{"Agree": "/Yes"} for _ in range(8)]
+
+    with pytest.raises(FileNotFoundError):
+        PdfEngine().fill_rows_parallel(
+            tmp_path / "missing.pdf",
+            tmp_path / "out",
+            {"Agree": "Agree"},
+            rows,
+            max_workers=2,
+        )
@@ -0,0 +1,83 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PySide6 import QtCore, QtTest, QtWidgets
+
+from pdf_bulk_filler.ui.rule_editor import _CHANGE_DEBOUNCE_MS, _ChoiceCaseEditor, _ChoiceConfigWidget
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    yield app
+    QtCore.QThreadPool.globalInstance().waitForDone()
+
+
+def _choice_options(count):
+    return {"source": "Choice", "cases": [{"match": str(i), "outputs": {"Field": str(i)}} for i in range(count)]}
+
+
+def test_choice_build_options_after_background_parse_finished(qapp):
+    widget = _ChoiceConfigWidget(["Choice"], ["Field"])
+    widget.load_options(_choice_options(500))
+    widget._ensure_built()
+    job = widget._parse_job
+    assert job is not None
+    # The parse has finished but its queued ``finished`` signal has not been delivered yet.
+    assert job.done.wait(10)
+    QtCore.QThreadPool.globalInstance().waitForDone()
+
+    options = widget.build_options()
+    assert [case["match"] for case in options["cases"]] == [str(i) for i in range(500)]
+    assert widget.validate()[0]
+
+    qapp.processEvents()
+    assert len(widget.build_options()["cases"]) == 500
+
+
+def _case_editor():
+    editor = _ChoiceCaseEditor(["Name"], ["FieldA", "FieldB"], include_match_field=True)
+    emitted = []
+    editor.changed.connect(lambda: emitted.append(True))
+    return editor, emitted
+
+
+def _type_burst(editor):
+    for text in ("a", "ab", "abc"):
+        editor._match_edit.setText(text)
+        editor._match_edit.textEdited.emit(text)
+    target_edit = editor._target_editors["FieldA"]._text_edit
+    target_edit.textEdited.emit("x")
+
+
+def test_case_editor_coalesces_edit_bursts(qapp):
+    editor, emitted = _case_editor()
+    _type_burst(editor)
+    assert emitted == []
+
+    QtTest.QTest.qWait(_CHANGE_DEBOUNCE_MS * 4)
+    assert emitted == [True]
+
+
+def test_case_editor_flush_pending_emits_synchronously(qapp):
+    editor, emitted = _case_editor()
+    _type_burst(editor)
+
+    editor.flush_pending()
+    assert emitted == [True]
+    QtTest.QTest.qWait(_CHANGE_DEBOUNCE_MS * 4)
+    assert emitted == [True]
+
+
+def test_choice_build_options_includes_pending_edit(qapp):
+    widget = _ChoiceConfigWidget(["Choice"], ["Field"])
+    widget.load_options(_choice_options(2))
+    widget._ensure_built()
+
+    match_edit = widget._case_editor._match_edit
+    match_edit.setText("edited")
+    match_edit.textEdited.emit("edited")
+
+    assert [case["match"] for case in widget.build_options()["cases"]] == ["edited", "1"]